@@ -1,11 +1,46 @@
 import os
-from time import clock
-import re
+import shutil
+import subprocess
+import tempfile
+import time
+
 import pulp
-import pulp.solvers
 
-class SCIP_CMD(pulp.solvers.LpSolver_CMD):
+try:
+    from pulp.apis import LpSolver_CMD
+except ImportError:  # PuLP < 2.0
+    from pulp.solvers import LpSolver_CMD
+
+
+SCIP_STATUS = {
+    "unknown": pulp.LpStatusNotSolved,
+    "user interrupt": pulp.LpStatusNotSolved,
+    "node limit reached": pulp.LpStatusNotSolved,
+    "total node limit reached": pulp.LpStatusNotSolved,
+    "stall node limit reached": pulp.LpStatusNotSolved,
+    "time limit reached": pulp.LpStatusNotSolved,
+    "memory limit reached": pulp.LpStatusNotSolved,
+    "gap limit reached": pulp.LpStatusNotSolved,
+    "solution limit reached": pulp.LpStatusNotSolved,
+    "solution improvement limit reached": pulp.LpStatusNotSolved,
+    "optimal solution found": pulp.LpStatusOptimal,
+    "infeasible": pulp.LpStatusInfeasible,
+    "unbounded": pulp.LpStatusUnbounded,
+    "infeasible or unbounded": pulp.LpStatusNotSolved,
+}
+
+
+class SCIP_CMD(LpSolver_CMD):
     """The SCIP LP solver"""
+
+    def __init__(self, path=None, keepFiles=False, msg=False, timeLimit=None, threads=None, gapRel=None,
+                 warmStart=False, options=None):
+        LpSolver_CMD.__init__(self, path=path, keepFiles=keepFiles, msg=msg, timeLimit=timeLimit,
+                              options=options)
+        self.threads = threads
+        self.gapRel = gapRel
+        self.warmStart = warmStart
+
     def defaultPath(self):
         return self.executableExtension("scip")
 
@@ -16,78 +51,105 @@ class SCIP_CMD(pulp.solvers.LpSolver_CMD):
     def actualSolve(self, lp):
         """Solve a well formulated lp problem"""
         if not self.executable(self.path):
-            raise pulp.PulpSolverError("PuLP: cannot execute "+self.path)
-        if not self.keepFiles:
-            pid = os.getpid()
-            tmpLp = os.path.join(self.tmpDir, "%d-pulp.lp" % pid)
-            tmpSol = os.path.join(self.tmpDir, "%d-pulp.sol" % pid)
-        else:
-            tmpLp = lp.name+"-pulp.lp"
-            tmpSol = lp.name+"-pulp.sol"
-        lp.writeLP(tmpLp, writeSOS = 0)
-        #proc = ["scip", "-c", "read \"%s\"" % tmpLp, "-c", "set limits time 180", "-c", "optimize", "-c", "write solution \"%s\"" % tmpSol, "-c", "quit"]
-        proc = ["scip", "-c", "read \"%s\"" % tmpLp, "-c", "optimize", "-c", "write solution \"%s\"" % tmpSol, "-c", "quit"]
-        proc.extend(self.options)
+            raise pulp.PulpSolverError("PuLP: cannot execute " + self.path)
+
+        tmp_dir = tempfile.mkdtemp(prefix="pulp-scip-", dir=self.tmpDir or None)
+        tmp_lp = os.path.join(tmp_dir, "model.lp")
+        tmp_start = os.path.join(tmp_dir, "start.sol")
+        tmp_sol = os.path.join(tmp_dir, "model.sol")
+        try:
+            lp.writeLP(tmp_lp, writeSOS=0)
+            start_values = self.warmStart and _start_values(lp)
+            if start_values:
+                _write_start(tmp_start, start_values)
+            proc = self.command(tmp_lp, tmp_sol, tmp_start if start_values else None)
 
-        self.solution_time = clock()
-        if not self.msg:
-            proc[0] = self.path
-            pipe = open(os.devnull, 'w')
-            rc = subprocess.call(proc, stdout = pipe,
-                             stderr = pipe)
+            output = None if self.msg else subprocess.DEVNULL
+            self.solution_time = -time.perf_counter()
+            rc = subprocess.call(proc, stdout=output, stderr=output)
+            self.solution_time += time.perf_counter()
             if rc:
-                raise pulp.PulpSolverError("PuLP: Error while trying to execute "+self.path)
-        else:
-            if os.name != 'nt':
-                rc = os.spawnvp(os.P_WAIT, self.path, proc)
-            else:
-                rc = os.spawnv(os.P_WAIT, self.executable(self.path), proc)
-            if rc == 127:
-                raise pulp.PulpSolverError("PuLP: Error while trying to execute "+self.path)
-        self.solution_time += clock()
-
-        if not os.path.exists(tmpSol):
-            raise pulp.PulpSolverError("PuLP: Error while executing "+self.path)
-        lp.status, values = self.readsol(tmpSol)
-        lp.assignVarsVals(values)
-        if not self.keepFiles:
-            try: os.remove(tmpLp)
-            except: pass
-            try: os.remove(tmpSol)
-            except: pass
-        return lp.status
+                raise pulp.PulpSolverError("PuLP: Error while trying to execute " + self.path)
+            if not os.path.exists(tmp_sol):
+                raise pulp.PulpSolverError("PuLP: Error while executing " + self.path)
+
+            status, sol_status, values = readsol(tmp_sol)
+        finally:
+            if self.keepFiles:
+                for path in (tmp_lp, tmp_start, tmp_sol):
+                    if os.path.exists(path):
+                        shutil.copy(path, lp.name + "-pulp" + os.path.splitext(path)[1])
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        all_values = dict.fromkeys((var.name for var in lp.variables()), 0.0)
+        all_values.update(values)
+        lp.assignVarsVals(all_values)
+        lp.assignStatus(status, sol_status)
+        return status
+
+    def command(self, lp_path, sol_path, start_path=None):
+        commands = ['read "%s"' % lp_path]
+        if start_path is not None:
+            commands.append('read "%s"' % start_path)
+        if self.timeLimit is not None:
+            commands.append("set limits time %s" % self.timeLimit)
+        if self.gapRel is not None:
+            commands.append("set limits gap %s" % self.gapRel)
+        if self.threads is not None:
+            commands.append("set lp threads %d" % self.threads)
+        commands.extend(["optimize", 'write solution "%s"' % sol_path, "quit"])
+
+        proc = [self.path]
+        for command in commands:
+            proc.extend(["-c", command])
+        proc.extend(self.options)
+        return proc
 
     def readsol(self, filename):
         """Read a SCIP solution file"""
-        with open(filename) as f:
-            m = re.match(r"^solution status: (.*)", f.readline().strip())
-            if not m:
-                raise pulp.PulpSolverError("Unknown status returned by SCIP")
-            statusString = m.group(1)
-            scipStatus = {
-                "unknown": pulp.LpStatusNotSolved,
-                "user interrupt": pulp.LpStatusNotSolved,
-                "node limit reached": pulp.LpStatusNotSolved,
-                "total node limit reached": pulp.LpStatusNotSolved,
-                "stall node limit reached": pulp.LpStatusNotSolved,
-                "time limit reached": pulp.LpStatusNotSolved,
-                "memory limit reached": pulp.LpStatusNotSolved,
-                "gap limit reached": pulp.LpStatusNotSolved,
-                "solution limit reached": pulp.LpStatusNotSolved,
-                "solution improvement limit reached": pulp.LpStatusNotSolved,
-                "optimal solution found": pulp.LpStatusOptimal,
-                "infeasible": pulp.LpStatusInfeasible,
-                "unbounded": pulp.LpStatusUnbounded,
-                "infeasible or unbounded": pulp.LpStatusNotSolved,
-                }
-            if statusString not in scipStatus:
-                raise pulp.PulpSolverError("Unknown status returned by SCIP")
-            status = scipStatus[statusString]
-            f.readline() # objective value: 
-            values = {}
-            for line in f:
-                name, val, _ = line.split()
-                values[name] = float(val)
+        status, _, values = readsol(filename)
         return status, values
 
+
+def readsol(filename):
+    with open(filename) as f:
+        first_line = f.readline()
+        if not first_line.startswith("solution status:"):
+            raise pulp.PulpSolverError("Unknown status returned by SCIP")
+        status_string = first_line[len("solution status:"):].strip()
+        if status_string not in SCIP_STATUS:
+            raise pulp.PulpSolverError("Unknown status returned by SCIP")
+        status = SCIP_STATUS[status_string]
+
+        values = {}
+        objective_line = f.readline()
+        if objective_line.startswith("objective value:"):
+            for line in f:
+                name, value = line.split(None, 2)[:2]
+                values[name] = float(value)
+
+    if status == pulp.LpStatusOptimal:
+        sol_status = pulp.LpSolutionOptimal
+    elif status == pulp.LpStatusInfeasible:
+        sol_status = pulp.LpSolutionInfeasible
+    elif status == pulp.LpStatusUnbounded:
+        sol_status = pulp.LpSolutionUnbounded
+    elif values or objective_line.startswith("objective value:"):
+        sol_status = pulp.LpSolutionIntegerFeasible
+    else:
+        sol_status = pulp.LpSolutionNoSolutionFound
+    return status, sol_status, values
+
+
+def _start_values(lp):
+    return {var.name: var.varValue for var in lp.variables() if var.varValue}
+
+
+def _write_start(path, values):
+    with open(path, "w") as f:
+        f.write("solution status: unknown\n")
+        for name, value in values.items():
+            f.write("%s %s\n" % (name, value))
+
+
 SCIP = SCIP_CMD
@@ -1,87 +1,192 @@
 import pprint
-from itertools import permutations
+from array import array
+from collections import defaultdict
+from operator import attrgetter
 
 from tandem.base_tandem import Seater, HUMANS
+from tandem.humans import language_ids
+from tandem.scoring import ranking_unhappiness, size_unhappiness
 from tandem.pulp_tandem import PulpMixin
 from tandem.gurobi_tandem import GurobiMixin
+from tandem.highs_tandem import HighsMixin, SparseModelMixin
+from tandem.local_search import packing_solution
+from tandem.heuristic_tandem import HeuristicMixin
+from tandem.scip_tandem import ScipMixin
+from tandem.portfolio_tandem import PortfolioMixin
 
 
 class BaseAsymmetricSeater(Seater):
 
+    kind = 'asymmetric'
+
+    def __init__(self, *args, rounds=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.aggregate_profiles:
+            raise ValueError("Round tables tie individual humans together, "
+                             "so asymmetric seatings cannot be aggregated by profile type")
+        if rounds is not None and rounds < 2:
+            raise ValueError("Every human has to teach and learn, so at least two rounds are needed")
+        self.rounds = rounds
+
     @staticmethod
-    def _valid_tables_with_languages(table):
-        common_languages = table[0].all_languages()
-        for human in table[1:]:
-            common_languages &= human.all_languages()
-            if not common_languages:
-                return
-
-        languages = _languages_with_teachers_and_pupils(table, common_languages)
-        for language in languages:
-            language_combination = frozenset((language,))
-            yield table, language_combination
+    def _language_masks(profiles):
+        return _languages_with_teachers_and_pupils(profiles)
 
     def _optimal_seatings(self, possible_tables):
-        possible_tables = set(possible_tables)
-        impossible_humans = set()
-        for human in self.humans:
-            is_teacher = False
-            is_pupil = False
-            for table in possible_tables:
-                if human in table[0] and _is_pupil(human, table):
-                    is_pupil = True
+        with self.stats.stage('pair_join') as stage:
+            tables = self._join_tables(possible_tables)
+            stage.counts['tables'] = len(tables)
 
-                if human in table[0] and _is_teacher(human, table[1]):
-                    is_teacher = True
+        is_seated, seating_model = self._solved_variables_and_model(tables)
 
-            if not (is_pupil and is_teacher):
-                impossible_humans.add(human)
+        return self._optimized_tables(is_seated, seating_model)
 
-        possible_tables = [(table, langs) for (table, langs) in possible_tables if not set(table) & impossible_humans]
-        possible_tables = permutations(possible_tables, 2)
-        possible_tables = [table_combo for table_combo in possible_tables if _valid_table_combo(table_combo)]
+    def _join_tables(self, possible_tables):
+        possible_tables = dict.fromkeys(possible_tables)
+        can_teach = set()
+        can_learn = set()
+        for language_table in possible_tables:
+            profiles, mask = possible_tables[language_table] = self._profile_table(language_table)
+            for profile in profiles:
+                if _is_teacher(profile, mask):
+                    can_teach.add(profile.human)
+                else:
+                    can_learn.add(profile.human)
+        impossible_humans = set(self.humans) - (can_teach & can_learn)
+
+        return {language_table: profile_table for language_table, profile_table in possible_tables.items()
+                if not set(language_table[0]) & impossible_humans}
+
+    def _built_model(self, tables):
+        seating_model = self._create_minimize_model("Tandem Seating Model")
+        if self.rounds is not None:
+            is_seated = self.lp_variable_dict(self._round_tables(tables), lower_bound=0, upper_bound=1,
+                                              model=seating_model)
+            self._update_model(seating_model)
+            return is_seated, self._make_round_model(seating_model, is_seated, tables)
+        is_seated = {}
+        seating_model = self._make_ilp_model(seating_model, is_seated, tables)
+        return is_seated, seating_model
+
+    def _heuristic_tables(self, tables):
+        if self.rounds is None:
+            return super()._heuristic_tables(list(_overlapping_table_combos(list(tables), tables)))
+
+        start_model = SparseModelMixin._create_minimize_model("Tandem Seating Start")
+        variables = SparseModelMixin.lp_variable_dict(self._round_tables(tables), lower_bound=0, upper_bound=1,
+                                                      model=start_model)
+        self._make_round_model(start_model, variables, tables, SparseModelMixin)
+        solution, _ = packing_solution(start_model, self.heuristic_start)
+        return {round_table for round_table, var in variables.items() if solution[var.index] == 1}
 
+    def _not_matched(self, seatings):
+        not_matched = []
+        for round_tables in seatings:
+            seated_humans = {human for humans, _ in round_tables for human in humans}
+            not_matched.append([human for human in self.humans if human not in seated_humans])
+        return tuple(not_matched)
+
+    def _round_tables(self, tables):
+        return [(language_table, round_idx) for round_idx in range(self.rounds) for language_table in tables]
+
+    def _make_round_model(self, seating_model, is_seated, tables, backend=None):
+        backend = backend or self
+        table_unhappiness = dict(zip(tables, self._table_unhappiness(list(tables))))
+        total_unhappiness = backend._solver_sum(table_unhappiness[language_table] * var
+                                                for (language_table, _), var in is_seated.items())
+        seating_model = backend._add_objective_function(total_unhappiness, seating_model)
+
+        round_rows = {human: [[] for _ in range(self.rounds)] for human in self.humans}
+        pupil_rows = {human: [] for human in self.humans}
+        teacher_rows = {human: [] for human in self.humans}
+        for (language_table, round_idx), var in is_seated.items():
+            profiles, mask = tables[language_table]
+            for profile in profiles:
+                round_rows[profile.human][round_idx].append(var)
+                if _is_pupil(profile, mask):
+                    pupil_rows[profile.human].append(var)
+                else:
+                    teacher_rows[profile.human].append(var)
 
-        is_seated, seating_model = self._solved_variables_and_model(possible_tables)
+        for human in self.humans:
+            for round_idx, row in enumerate(round_rows.pop(human)):
+                seating_model = backend._add_constraint(backend._solver_sum(row) == 1,
+                                                        "Must_seat_exatcly_once_round{}_{}".format(round_idx + 1,
+                                                                                                   human),
+                                                        seating_model)
+            seating_model = backend._add_constraint(backend._solver_sum(pupil_rows.pop(human)) >= 1,
+                                                    "Must_seat_as_pupil_{}".format(human), seating_model)
+            seating_model = backend._add_constraint(backend._solver_sum(teacher_rows.pop(human)) >= 1,
+                                                    "Must_seat_as_teacher_{}".format(human), seating_model)
 
-        return self._optimized_tables(is_seated, seating_model)
+        return seating_model
 
-    def _not_matched(self, seatings):
-        seated_humans_round_1 = set()
-        seated_humans_round_2 = set()
-        for (humans_1, _), (humans_2, _) in zip(*seatings):
-            seated_humans_round_1.update(humans_1)
-            seated_humans_round_2.update(humans_2)
-        not_matched_round_1 = [human for human in self.humans if human not in seated_humans_round_1]
-        not_matched_round_2 = [human for human in self.humans if human not in seated_humans_round_2]
-        return not_matched_round_1, not_matched_round_2
-
-    def _make_ilp_model(self, seating_model, is_seated_ilp, possible_tables):
-        total_unhappiness = self._solver_sum(_unhappiness(*language_table) * is_seated_ilp[language_table]
-                                             for language_table in possible_tables)
+    def _make_ilp_model(self, seating_model, is_seated_ilp, tables):
+        table_unhappiness = dict(zip(tables, self._table_unhappiness(list(tables))))
+        table_lp = self._table_lp_variable(0, 1, seating_model)
+
+        coefficients = array('d')
+        round1_rows = {human: [] for human in self.humans}
+        round2_rows = {human: [] for human in self.humans}
+        pupil_rows = {human: [] for human in self.humans}
+        # the pairs are streamed into the model, so their enumeration is timed as a second pair_join stage
+        table_combos = self.stats.iterate('pair_join', _overlapping_table_combos(list(tables), tables), 'pairs')
+        for table_combo in table_combos:
+            var = is_seated_ilp[table_combo] = table_lp(len(is_seated_ilp))
+            coefficients.append(table_unhappiness[table_combo[0]] + table_unhappiness[table_combo[1]])
+            for round_rows, language_table in zip((round1_rows, round2_rows), table_combo):
+                profiles, mask = tables[language_table]
+                for profile in profiles:
+                    round_rows[profile.human].append(var)
+                    if _is_pupil(profile, mask):
+                        pupil_rows[profile.human].append(var)
+        self._update_model(seating_model)
+
+        total_unhappiness = self._solver_sum(coefficient * var
+                                             for coefficient, var in zip(coefficients, is_seated_ilp.values()))
         seating_model = self._add_objective_function(total_unhappiness, seating_model)
+        del coefficients
 
         for human in self.humans:
-            round1_variables, round2_variables, pupil_variables = _ilp_variables(human,
-                                                                                 possible_tables,
-                                                                                 is_seated_ilp)
+            rows = (("Must_seat_exatcly_once_round1_{}", round1_rows.pop(human)),
+                    ("Must_seat_exatcly_once_round2_{}", round2_rows.pop(human)),
+                    ("Must_seat_as_pupil_{}", pupil_rows.pop(human)))
+            for name, row in rows:
+                seating_model = self._add_constraint(self._solver_sum(row) == 1, name.format(human), seating_model)
 
-            total_seatings_round1 = self._solver_sum(round1_variables)
-            name = "Must_seat_exatcly_once_round1_{}".format(human)
-            seating_model = self._add_constraint(total_seatings_round1 == 1, name, seating_model)
+        return seating_model
 
-            total_seatings_round2 = self._solver_sum(round2_variables)
-            name = "Must_seat_exatcly_once_round2_{}".format(human)
-            seating_model = self._add_constraint(total_seatings_round2 == 1, name, seating_model)
+    def _constraint_rows(self, possible_tables):
+        round1_rows = {human: [] for human in self.humans}
+        round2_rows = {human: [] for human in self.humans}
+        pupil_rows = {human: [] for human in self.humans}
 
-            total_seatings_as_pupil = self._solver_sum(pupil_variables)
-            name = "Must_seat_as_pupil_{}".format(human)
-            seating_model = self._add_constraint(total_seatings_as_pupil == 1, name, seating_model)
+        for idx, table_combo in enumerate(possible_tables):
+            for round_rows, language_table in zip((round1_rows, round2_rows), table_combo):
+                profiles, mask = self._profile_table(language_table)
+                for profile in profiles:
+                    round_rows[profile.human].append(idx)
+                    if _is_pupil(profile, mask):
+                        pupil_rows[profile.human].append(idx)
 
-        return seating_model
+        for human in self.humans:
+            yield "Must_seat_exatcly_once_round1_{}".format(human), round1_rows[human]
+            yield "Must_seat_exatcly_once_round2_{}".format(human), round2_rows[human]
+            yield "Must_seat_as_pupil_{}".format(human), pupil_rows[human]
+
+    def _objective_coefficients(self, possible_tables):
+        tables = list({table for table_combo in possible_tables for table in table_combo})
+        table_unhappiness = dict(zip(tables, self._table_unhappiness(tables)))
+        return [table_unhappiness[table_1] + table_unhappiness[table_2] for table_1, table_2 in possible_tables]
+
+    def _table_unhappiness(self, tables):
+        matrices = self._table_matrices(tables)
+        return (ranking_unhappiness(matrices) + size_unhappiness(matrices)).tolist()
 
     def _optimized_tables(self, is_seated_ilp, seating_model):
-        chosen_tables = self._chosen_tables(is_seated_ilp, seating_model)
+        chosen_tables = self._solution_tables(is_seated_ilp, seating_model)
+        if self.rounds is not None:
+            return self._round_seatings(chosen_tables)
 
         all_round1 = []
         all_round2 = []
@@ -97,13 +202,28 @@ class BaseAsymmetricSeater(Seater):
 
         return all_round1, all_round2
 
+    def _round_seatings(self, chosen_tables):
+        seatings = tuple([] for _ in range(self.rounds))
+        for language_table, round_idx in chosen_tables:
+            seatings[round_idx].append(language_table)
+        return seatings
+
 
-def _languages_with_teachers_and_pupils(table, common_languages):
-    for language in common_languages:
+def _languages_with_teachers_and_pupils(profiles):
+    common_languages = profiles[0].languages
+    for profile in profiles[1:]:
+        common_languages &= profile.languages
+        if not common_languages:
+            return
+
+    # how often a language is yielded depends on the order of the table, so count in a canonical order
+    profiles = sorted(profiles, key=attrgetter('teaching'))
+    for language_id in language_ids(common_languages):
+        language = 1 << language_id
         has_teachers = False
         has_pupils = False
-        for human in table:
-            if language in human.teaching_languages:
+        for profile in profiles:
+            if profile.teaching & language:
                 has_teachers = True
             else:
                 has_pupils = True
@@ -111,65 +231,57 @@ def _languages_with_teachers_and_pupils(table, common_languages):
                 yield language
 
 
-def _unhappiness(table1, table2):
-    total_unhappiness = _ranking_unhappiness(*table1)
-    total_unhappiness += _ranking_unhappiness(*table2)
+def _unhappiness(profile_table1, profile_table2):
+    total_unhappiness = _ranking_unhappiness(*profile_table1)
+    total_unhappiness += _ranking_unhappiness(*profile_table2)
 
-    total_unhappiness += 0.01 * len(table1[0]) ** 2
-    total_unhappiness += 0.01 * len(table2[0]) ** 2
+    total_unhappiness += 0.01 * len(profile_table1[0]) ** 2
+    total_unhappiness += 0.01 * len(profile_table2[0]) ** 2
 
     return total_unhappiness
 
-def _ranking_unhappiness(table, language_combination):
+def _ranking_unhappiness(profiles, mask):
     ranking_unhappiness = 0
-    for human in table:
-        for idx, (learning_language, _) in enumerate(human.learning_languages):
-            if learning_language in language_combination:
-                ranking_unhappiness += idx
-                break
+    for profile in profiles:
+        learning = profile.first_learning(mask)
+        if learning is not None:
+            ranking_unhappiness += learning[0]
     return ranking_unhappiness
 
 
-def _ilp_variables(human, possible_tables, is_seated_ilp):
-    round1_variables = []
-    round2_variables = []
-    pupil_variables = []
-
-    for table_1, table_2 in possible_tables:
-        if human in table_1[0]:
-            round1_variables.append(is_seated_ilp[(table_1, table_2)])
-
-            if _is_pupil(human, table_1[1]):
-                pupil_variables.append(is_seated_ilp[(table_1, table_2)])
-
-        if human in table_2[0]:
-            round2_variables.append(is_seated_ilp[(table_1, table_2)])
-
-            if _is_pupil(human, table_2[1]):
-                pupil_variables.append(is_seated_ilp[(table_1, table_2)])
+def _overlapping_table_combos(possible_tables, profile_tables):
+    tables_by_human = defaultdict(list)
+    for idx, (table, _) in enumerate(possible_tables):
+        for human in table:
+            tables_by_human[human].append(idx)
 
-    return round1_variables, round2_variables, pupil_variables
+    for idx, table_1 in enumerate(possible_tables):
+        overlapping = set()
+        for human in table_1[0]:
+            overlapping.update(tables_by_human[human])
+        overlapping.discard(idx)
 
+        for other_idx in sorted(overlapping):
+            table_2 = possible_tables[other_idx]
+            if _valid_table_combo(profile_tables[table_1], profile_tables[table_2]):
+                yield table_1, table_2
 
-def _is_teacher(human, table_language_combination):
-    for language in table_language_combination:
-        if language in human.teaching_languages:
-            return True
 
-    return False
+def _is_teacher(profile, mask):
+    return bool(profile.teaching & mask)
 
 
-def _valid_table_combo(table_combo):
-    (table1, langs1), (table2, langs2) = table_combo
-    overlapping_humans = set(table1) & set(table2)
-    if not overlapping_humans:
+def _valid_table_combo(profile_table1, profile_table2):
+    (profiles1, mask1), (profiles2, mask2) = profile_table1, profile_table2
+    overlapping_profiles = set(profiles1) & set(profiles2)
+    if not overlapping_profiles:
         return False
 
-    for human in overlapping_humans:
-        is_teacher1 = _is_teacher(human, langs1)
-        is_teacher2 = _is_teacher(human, langs2)
-        is_pupil1 = _is_pupil(human, langs1)
-        is_pupil2 = _is_pupil(human, langs2)
+    for profile in overlapping_profiles:
+        is_teacher1 = _is_teacher(profile, mask1)
+        is_teacher2 = _is_teacher(profile, mask2)
+        is_pupil1 = not is_teacher1
+        is_pupil2 = not is_teacher2
 
         is_teacher_then_pupil = is_teacher1 and is_pupil2
         is_pupil_then_teacher = is_teacher2 and is_pupil1
@@ -180,8 +292,8 @@ def _valid_table_combo(table_combo):
     return True
 
 
-def _is_pupil(human, table_language_combination):
-    return not _is_teacher(human, table_language_combination)
+def _is_pupil(profile, mask):
+    return not _is_teacher(profile, mask)
 
 
 class AsymmetricPulpSeater(BaseAsymmetricSeater, PulpMixin):
@@ -192,6 +304,22 @@ class AsymmetricGurobiSeater(BaseAsymmetricSeater, GurobiMixin):
     pass
 
 
+class AsymmetricHighsSeater(BaseAsymmetricSeater, HighsMixin):
+    pass
+
+
+class AsymmetricHeuristicSeater(BaseAsymmetricSeater, HeuristicMixin):
+    pass
+
+
+class AsymmetricScipSeater(BaseAsymmetricSeater, ScipMixin):
+    pass
+
+
+class AsymmetricPortfolioSeater(BaseAsymmetricSeater, PortfolioMixin):
+    pass
+
+
 if __name__ == '__main__':
     seater = AsymmetricGurobiSeater(HUMANS, 3, 1)
     print(seater.seat())
@@ -1,9 +1,17 @@
 import abc
+import copy
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-import pulp
-
-from tandem.humans import Human
-import hashlib
+from tandem.humans import Human, LanguageTable, Profile, language_ids
+from tandem.scoring import table_matrices
+from tandem.components import roster_components, component_tables, map_humans, merged_seatings, seat_indexed
+from tandem.local_search import packing_solution
+from tandem.sparse_model import SparseModel, sparse_sum
+from tandem.stats import SeatingStats, OPTIMAL, FEASIBLE, NOT_SOLVED
+from tandem.solver_options import SolverOptions
 
 
 HUMANS = [Human(name='anna', learning_languages=[('german', 10)], teaching_languages=['french', 'english']),
@@ -25,19 +33,244 @@ HUMANS = [Human(name='anna', learning_languages=[('german', 10)], teaching_langu
 
 class Seater(abc.ABC):
 
-    def __init__(self, humans, max_table_size, max_level_difference):
+    reports_incumbents = False
+
+    def __init__(self, humans, max_table_size, max_level_difference, heuristic_start=None, candidate_cache=None,
+                 aggregate_profiles=False, on_stage=None, trace_memory=False, solver_options=None, language_table=None):
         self.humans = humans
         self.max_table_size = max_table_size
         self.max_level_difference = max_level_difference
+        self.language_table = language_table if language_table is not None else LanguageTable()
+        self.profiles = {human: Profile(human, self.language_table) for human in humans}
+        self.positions = {human: idx for idx, human in enumerate(humans)}
+        self.candidates = None
+        self.heuristic_start = heuristic_start
+        self.previous_tables = {}
+        self.start_tables = set()
+        self.candidate_cache = candidate_cache
+        self.aggregate_profiles = aggregate_profiles
+        self.variable_tables = []
+        self.on_stage = on_stage
+        self.trace_memory = trace_memory
+        self.solver_options = solver_options or SolverOptions()
+        self.deadline = None
+        self.stats = self._new_stats()
 
     def seat(self):
-        possible_tables = list(self._filtered_tables())
-        seatings = self._optimal_seatings(possible_tables)
+        self._start_seating()
+        return self._seat_round()
+
+    def _seat_round(self):
+        if self.aggregate_profiles:
+            seatings = self._aggregated_seatings()
+        else:
+            possible_tables = self._candidate_tables()
+            seatings = self._optimal_seatings(possible_tables)
         not_matched = self._not_matched(seatings)
 
         return seatings, not_matched
+
+    def _new_stats(self):
+        return SeatingStats(self.on_stage, self.trace_memory)
+
+    def _start_seating(self):
+        self.stats = self._new_stats()
+        self.deadline = self.solver_options.deadline()
+
+    def _time_left(self):
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0)
+
+    def seat_by_components(self, max_workers=None):
+        self._start_seating()
+        possible_tables = self._candidate_tables()
+        with self.stats.stage('components') as stage:
+            components = roster_components(self.humans, possible_tables)
+            stage.counts['components'] = len(components)
+
+        seaters = []
+        for humans, tables in zip(components, component_tables(components, possible_tables)):
+            if tables:
+                seater = self._subseater(humans)
+                seater.candidates = tables
+                seaters.append(seater)
+
+        if not seaters:
+            return self.seat()
+        with self.stats.stage('component_seating', components=len(seaters)):
+            if len(seaters) == 1:
+                parts = [seaters[0].seat()[0]]
+            else:
+                with ProcessPoolExecutor(max_workers) as executor:
+                    indexed_parts = list(executor.map(seat_indexed, seaters))
+                parts = [map_humans(part, seater.humans)
+                         for part, seater in zip(indexed_parts, seaters)]
+
+        seatings = merged_seatings(parts)
+        return seatings, self._unseated(seatings)
+
+    def add_human(self, human):
+        self.humans = self.humans + [human]
+        profile = self.profiles[human] = Profile(human, self.language_table)
+        self.positions[human] = len(self.humans) - 1
+        if self.candidates is not None:
+            self.candidates.extend(self._filtered_tables(self._tables_with(profile, self.humans[:-1])))
+
+    def remove_human(self, human):
+        self.humans = [other for other in self.humans if other is not human]
+        del self.profiles[human]
+        self.positions = {other: idx for idx, other in enumerate(self.humans)}
+        if self.candidates is not None:
+            self.candidates = [(table, languages) for table, languages in self.candidates if human not in table]
+
+    def update_roster(self, humans):
+        current = _by_fingerprint(self.humans)
+        wanted = _by_fingerprint(humans)
+        for fingerprint, current_humans in current.items():
+            surplus = len(current_humans) - len(wanted.get(fingerprint, ()))
+            for human in current_humans[len(current_humans) - surplus:]:
+                self.remove_human(human)
+        for fingerprint, wanted_humans in wanted.items():
+            missing = len(wanted_humans) - len(current.get(fingerprint, ()))
+            for human in wanted_humans[len(wanted_humans) - missing:]:
+                self.add_human(human)
+
+    def _aggregated_seatings(self):
+        with self.stats.stage('type_tables') as stage:
+            types = _profile_types(self.humans, self._type_key)
+            counts = [len(humans) for humans in types]
+            type_profiles = [self.profiles[humans[0]] for humans in types]
+
+            keys = []
+            representatives = []
+            for type_table in _type_tables(type_profiles, counts, self.max_table_size):
+                table = _representative_table(type_table, types)
+                masks = Counter(self._valid_language_masks([self.profiles[human] for human in table]))
+                # a candidate yielded twice can never satisfy an individual "seat exactly once" row
+                for mask in (mask for mask, count in masks.items() if count == 1):
+                    language_combination = self.language_table.combination(mask)
+                    keys.append((type_table, language_combination))
+                    representatives.append((table, language_combination))
+            stage.counts.update(types=len(types), candidates=len(keys))
+
+        with self.stats.stage('model_build') as stage:
+            seating_model = self._create_minimize_model("Tandem Type Seating Model")
+            multiplicity = self.lp_variable_dict(keys,
+                                                 lower_bound=0,
+                                                 upper_bound=len(self.humans),
+                                                 model=seating_model)
+            self._update_model(seating_model)
+
+            coefficients = self._objective_coefficients(representatives)
+            total_unhappiness = self._solver_sum(coefficient * multiplicity[key]
+                                                 for coefficient, key in zip(coefficients, keys))
+            seating_model = self._add_objective_function(total_unhappiness, seating_model)
+
+            rows = [[] for _ in types]
+            for key in keys:
+                for type_idx, count in Counter(key[0]).items():
+                    rows[type_idx].append((count, multiplicity[key]))
+            for type_idx, row in enumerate(rows):
+                total_seatings = self._solver_sum(count * var for count, var in row)
+                name = "Must_seat_type_{}".format(type_idx)
+                seating_model = self._add_constraint(total_seatings == counts[type_idx], name, seating_model)
+            self._count_model(stage, seating_model)
+
+        self._solve_stage(seating_model)
+        with self.stats.stage('chosen_tables') as stage:
+            chosen = {}
+            for key, var in multiplicity.items():
+                value = self._variable_value(var, seating_model)
+                if value is not None and round(value) > 0:
+                    chosen[key] = int(round(value))
+            seatings = self._expanded_seatings(chosen, types)
+            stage.counts['tables'] = len(seatings)
+        return seatings
+
+    def _expanded_seatings(self, chosen, types):
+        used = Counter()
+        for (type_table, _), multiplicity in chosen.items():
+            for type_idx, count in Counter(type_table).items():
+                used[type_idx] += count * multiplicity
+        if any(used[type_idx] > len(humans) for type_idx, humans in enumerate(types)):
+            return []
+
+        next_human = [0] * len(types)
+        seatings = []
+        for (type_table, language_combination), multiplicity in chosen.items():
+            for _ in range(multiplicity):
+                table = []
+                for type_idx in type_table:
+                    table.append(types[type_idx][next_human[type_idx]])
+                    next_human[type_idx] += 1
+                seatings.append((tuple(sorted(table, key=self.positions.get)), language_combination))
+        return seatings
+
+    def _type_key(self, human):
+        return human.fingerprint()[1:]
+
+    def _candidate_tables(self):
+        if self.candidates is None and self.candidate_cache is not None:
+            self.candidates = self.candidate_cache.candidates(self)
+        elif self.candidates is None:
+            with self.stats.stage('filtered_tables') as stage:
+                tables = self.stats.iterate('tables', self._tables())
+                self.candidates = list(self._filtered_tables(tables))
+                stage.counts['candidates'] = len(self.candidates)
+        return list(self.candidates)
+
+    def _extended_candidates(self, candidates, new_humans):
+        new_humans = set(new_humans)
+        known_humans = [human for human in self.humans if human not in new_humans]
+        for human in self.humans:
+            if human in new_humans:
+                candidates.extend(self._filtered_tables(self._tables_with(self.profiles[human], known_humans)))
+                known_humans.append(human)
+        return candidates
+
+    def _subseater(self, humans):
+        seater = copy.copy(self)
+        seater.humans = humans
+        seater.profiles = {human: self.profiles[human] for human in humans}
+        seater.positions = {human: idx for idx, human in enumerate(humans)}
+        seater.candidates = None
+        seater.previous_tables = {}
+        seater.on_stage = None
+        seater.stats = seater._new_stats()
+        return seater
+
+    def _unseated(self, seatings):
+        return self._not_matched(seatings)
     
     def _solved_variables_and_model(self, possible_tables):
+        with self.stats.stage('model_build') as stage:
+            is_seated, seating_model = self._built_model(possible_tables)
+            self.variable_tables = list(is_seated)
+            self._count_model(stage, seating_model)
+        start_tables = self.previous_tables.get(self._model_key())
+        if start_tables is None and self.heuristic_start:
+            with self.stats.stage('heuristic_start') as stage:
+                start_tables = self._heuristic_tables(possible_tables)
+                stage.counts['tables'] = len(start_tables)
+        self.start_tables = set(start_tables or ())
+        if start_tables:
+            self._set_start(is_seated, start_tables, seating_model)
+        del(possible_tables)
+        self._solve_stage(seating_model)
+        with self.stats.stage('chosen_tables') as stage:
+            chosen_tables = set(self._solution_tables(is_seated, seating_model))
+            stage.counts['tables'] = len(chosen_tables)
+        self.previous_tables[self._model_key()] = chosen_tables
+        return is_seated, seating_model
+
+    def _solution_tables(self, variables, model):
+        chosen_tables = list(self._chosen_tables(variables, model))
+        if chosen_tables or self._model_status(model) != NOT_SOLVED and self._time_left() != 0:
+            return chosen_tables
+        return [language_table for language_table in variables if language_table in self.start_tables]
+
+    def _built_model(self, possible_tables):
         seating_model = self._create_minimize_model("Tandem Seating Model")
         is_seated = self.lp_variable_dict(possible_tables,
                                           lower_bound=0,
@@ -45,35 +278,106 @@ class Seater(abc.ABC):
                                           model=seating_model)
         self._update_model(seating_model)
         seating_model = self._make_ilp_model(seating_model, is_seated, possible_tables)
-        del(possible_tables)
-        self._solve_model(seating_model)   
         return is_seated, seating_model
+
+    def _solve_stage(self, model):
+        with self.stats.stage('solve') as stage:
+            self._solve_model(model)
+            stage.status = self._model_status(model)
+        on_incumbent = self.solver_options.on_incumbent
+        if on_incumbent is not None and not self.reports_incumbents and stage.status in (OPTIMAL, FEASIBLE):
+            on_incumbent(self._objective_value(model))
+
+    def _count_model(self, stage, model):
+        variables, constraints, nonzeros = self._model_size(model)
+        stage.counts.update(variables=variables, constraints=constraints, nonzeros=nonzeros)
+
+    def _model_key(self):
+        return None
         
+    def _heuristic_tables(self, possible_tables):
+        start_model = SparseModel("Tandem Seating Start")
+        variables = {}
+        for language_table in possible_tables:
+            if language_table not in variables:
+                variables[language_table] = start_model.add_variable(0, 1)
+
+        coefficients = self._objective_coefficients(possible_tables)
+        start_model.set_objective(sparse_sum(coefficient * variables[language_table]
+                                             for coefficient, language_table in zip(coefficients,
+                                                                                    possible_tables)))
+        for name, row in self._constraint_rows(possible_tables):
+            start_model.add_constraint(sparse_sum(variables[possible_tables[idx]] for idx in row) == 1, name)
+
+        solution, _ = packing_solution(start_model, self.heuristic_start)
+        return {language_table for language_table, var in variables.items() if solution[var.index] == 1}
+
     def _tables(self):
-        tables = pulp.allcombinations(self.humans, self.max_table_size)
-        return (table for table in tables if len(table) > 1)
-
-    def _filtered_tables(self):
-        all_tables = self._tables()
-        for posible_table in all_tables:
-            tables_with_languages = self._valid_tables_with_languages(posible_table)
-            for table, language_combination in tables_with_languages:
-                if _acceptable_level_difference(table,
-                                                language_combination,
-                                                self.max_level_difference):
-                    yield table, language_combination
+        profiles = [self.profiles[human] for human in self.humans]
+        return _language_tables(profiles, self.max_table_size)
+
+    def _tables_with(self, profile, other_humans):
+        others = [self.profiles[human] for human in other_humans]
+        speakers = _speakers_by_language(others)
+        tables = _grown_tables((), -1, profile.languages, others, speakers, self.max_table_size - 1, min_size=1)
+        return (tuple(sorted(table + (profile,), key=self._profile_position)) for table in tables)
+
+    def _profile_position(self, profile):
+        return self.positions[profile.human]
+
+    def _filtered_tables(self, tables=None):
+        if tables is None:
+            tables = self._tables()
+        for profiles in tables:
+            masks = list(self._valid_language_masks(profiles))
+            if masks:
+                table = tuple(profile.human for profile in profiles)
+                for mask in masks:
+                    yield table, self.language_table.combination(mask)
+
+    def _valid_tables_with_languages(self, table):
+        profiles = [self.profiles[human] for human in table]
+        for mask in self._valid_language_masks(profiles):
+            yield table, self.language_table.combination(mask)
+
+    def _valid_language_masks(self, profiles):
+        for mask in self._language_masks(profiles):
+            if _acceptable_level_spread(profiles, mask, self.max_level_difference):
+                yield mask
+
+    def _profile_table(self, language_table):
+        table, language_combination = language_table
+        profiles = [self.profiles[human] for human in table]
+        return profiles, self.language_table.mask(language_combination)
+
+    def _human_incidence(self, language_tables):
+        incidence = {human: [] for human in self.humans}
+        for idx, (table, _) in enumerate(language_tables):
+            for human in table:
+                incidence[human].append(idx)
+        return incidence
+
+    def _table_matrices(self, language_tables):
+        profile_tables = [self._profile_table(language_table) for language_table in language_tables]
+        return table_matrices(profile_tables, self.positions)
          
     @classmethod         
     def lp_variable_dict(cls, objs, lower_bound, upper_bound, model):
         table_lp = cls._table_lp_variable(lower_bound, upper_bound, model)
-        return dict((obj, table_lp(obj)) for obj in objs)
-    
+        variables = {}
+        for obj in objs:
+            if obj not in variables:
+                variables[obj] = table_lp(len(variables))
+        return variables
+
     @staticmethod
-    def _hash_table(table):
-        sha = hashlib.sha1()
-        sha.update(repr(table).encode('utf8'))
-        return '_' + sha.hexdigest()[:10]
+    def _variable_name(variable_id):
+        return 't{}'.format(variable_id)
     
+    @staticmethod
+    def _set_start(variables, start_tables, model):
+        pass
+
     @abc.abstractmethod
     def _optimized_tables(self, variables, model):
         ...
@@ -83,7 +387,7 @@ class Seater(abc.ABC):
         ...
 
     @abc.abstractstaticmethod
-    def _valid_tables_with_languages(table):
+    def _language_masks(profiles):
         ...
         
     @abc.abstractclassmethod
@@ -101,6 +405,22 @@ class Seater(abc.ABC):
     @abc.abstractstaticmethod
     def _solve_model(model):
         ...
+
+    @abc.abstractstaticmethod
+    def _variable_value(var, model):
+        ...
+
+    @abc.abstractstaticmethod
+    def _model_status(model):
+        ...
+
+    @abc.abstractstaticmethod
+    def _model_size(model):
+        ...
+
+    @abc.abstractstaticmethod
+    def _objective_value(model):
+        ...
         
     @abc.abstractstaticmethod
     def _update_model(model):
@@ -127,28 +447,93 @@ class Seater(abc.ABC):
         ...
         
 
-def _acceptable_level_difference(table, languages, max_difference):
-    for language in languages:
-        levels = _learning_levels(table, language)
-        if _max_difference(levels) > max_difference:
+def _by_fingerprint(humans):
+    grouped = defaultdict(list)
+    for human in humans:
+        grouped[human.fingerprint()].append(human)
+    return grouped
+
+
+def _profile_types(humans, type_key):
+    types = {}
+    for human in humans:
+        types.setdefault(type_key(human), []).append(human)
+    return list(types.values())
+
+
+def _representative_table(type_table, types):
+    table = []
+    for type_idx, count in sorted(Counter(type_table).items()):
+        table.extend(types[type_idx][:count])
+    return tuple(table)
+
+
+def _type_tables(type_profiles, counts, max_table_size):
+    speakers = _speakers_by_language(type_profiles)
+
+    for idx, profile in enumerate(type_profiles):
+        yield from _grown_type_tables((idx,), profile.languages,
+                                      type_profiles, counts, speakers, max_table_size)
+
+
+def _grown_type_tables(table, common_languages, type_profiles, counts, speakers, max_table_size):
+    if len(table) > 1:
+        yield table
+    if len(table) == max_table_size:
+        return
+
+    last_idx = table[-1]
+    candidates = set()
+    for language_id in language_ids(common_languages):
+        language_speakers = speakers[language_id]
+        candidates.update(language_speakers[bisect_left(language_speakers, last_idx):])
+
+    for idx in sorted(candidates):
+        if idx == last_idx and table.count(idx) == counts[idx]:
+            continue
+        shared_languages = common_languages & type_profiles[idx].languages
+        yield from _grown_type_tables(table + (idx,), shared_languages,
+                                      type_profiles, counts, speakers, max_table_size)
+
+
+def _acceptable_level_spread(profiles, mask, max_difference):
+    for language_id in language_ids(mask):
+        levels = [profile.levels[profile.learning_ids.index(language_id)]
+                  for profile in profiles if profile.learning >> language_id & 1]
+        if levels and max(levels) - min(levels) > max_difference:
             return False
 
     return True
 
 
-def _learning_levels(table, language):
-    levels = []
-    for human in table:
-        for learning_language, level in human.learning_languages:
-            if learning_language == language:
-                levels.append(level)
-                break
-    return levels
+def _language_tables(profiles, max_table_size):
+    speakers = _speakers_by_language(profiles)
+
+    for idx, profile in enumerate(profiles):
+        yield from _grown_tables((profile,), idx, profile.languages,
+                                 profiles, speakers, max_table_size)
+
 
+def _speakers_by_language(profiles):
+    speakers = defaultdict(list)
+    for idx, profile in enumerate(profiles):
+        for language_id in language_ids(profile.languages):
+            speakers[language_id].append(idx)
+    return speakers
 
-def _max_difference(levels):
-    levels = [int(i) for i in levels]
-    return max(levels) - min(levels)
 
+def _grown_tables(table, last_idx, common_languages, profiles, speakers, max_table_size, min_size=2):
+    if len(table) >= min_size:
+        yield table
+    if len(table) == max_table_size:
+        return
 
+    candidates = set()
+    for language_id in language_ids(common_languages):
+        language_speakers = speakers[language_id]
+        candidates.update(language_speakers[bisect_right(language_speakers, last_idx):])
 
+    for idx in sorted(candidates):
+        shared_languages = common_languages & profiles[idx].languages
+        yield from _grown_tables(table + (profiles[idx],), idx, shared_languages,
+                                 profiles, speakers, max_table_size, min_size)
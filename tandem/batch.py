@@ -0,0 +1,71 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tandem.candidate_cache import CandidateCache
+from tandem.humans import LanguageTable
+from tandem.payloads import seating_request, seater_from_request, roster_positions, encode_seatings, decode_seatings
+from tandem.registry import SEATERS
+from tandem.result_cache import seating_key
+
+
+SEATER_CLASSES = {seater_class.__name__: seater_class
+                  for backends in SEATERS.values() for seater_class in backends.values()}
+
+_language_table = None
+_candidate_cache = None
+
+
+def seat_batch(jobs, backend='highs', max_workers=None, candidate_cache_path=None, result_cache=None):
+    pending = {}
+    with ProcessPoolExecutor(max_workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=(candidate_cache_path,)) as executor:
+        futures = {}
+        for index, (humans, kind, parameters) in enumerate(jobs):
+            parameters = dict(parameters)
+            seater_class = SEATERS[kind][backend]
+            roster = sorted(humans, key=_fingerprint_order)
+            max_table_size = parameters.pop('max_table_size')
+            max_level_difference = parameters.pop('max_level_difference')
+            key = seating_key(seater_class, roster, max_table_size, max_level_difference) + \
+                (repr(sorted(parameters.items())),)
+
+            cached = None if result_cache is None else result_cache.get(key)
+            if cached is not None:
+                yield (index,) + decode_seatings(cached, roster)
+            elif key in pending:
+                pending[key].append((index, roster))
+            else:
+                pending[key] = [(index, roster)]
+                request = seating_request(seater_class, roster, max_table_size, max_level_difference)
+                futures[executor.submit(_seat_request, request, parameters)] = key
+
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                result = future.result()
+            except Exception as error:
+                # a failed job is reported in place of its seatings, the other jobs keep streaming
+                for index, _ in pending.pop(key):
+                    yield index, error, None
+                continue
+            if result_cache is not None:
+                result_cache.put(key, result)
+            for index, roster in pending.pop(key):
+                yield (index,) + decode_seatings(result, roster)
+
+
+def _fingerprint_order(human):
+    return repr(human.fingerprint())
+
+
+def _init_worker(candidate_cache_path):
+    global _language_table, _candidate_cache
+    _language_table = LanguageTable()
+    _candidate_cache = None if candidate_cache_path is None else CandidateCache(candidate_cache_path)
+
+
+def _seat_request(request, parameters):
+    seater = seater_from_request(request, SEATER_CLASSES, language_table=_language_table,
+                                 candidate_cache=_candidate_cache, **parameters)
+    seatings, unseated = seater.seat()
+    return encode_seatings(seatings, unseated, roster_positions(seater.humans, seater.humans))
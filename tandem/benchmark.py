@@ -0,0 +1,169 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+
+from tandem.humans import Human
+from tandem.portfolio_tandem import available_solvers
+from tandem.registry import SEATERS
+
+
+LANGUAGES = ['english', 'german', 'french', 'spanish', 'italian', 'portuguese', 'russian', 'greek']
+
+DEFAULT_SIZES = [10, 20, 40]
+DEFAULT_BACKENDS = ['highs', 'heuristic']
+# backends that need a licence or a solver binary which may be missing
+EXTERNAL_BACKENDS = ('gurobi', 'scip')
+
+
+def synthetic_roster(size, languages=LANGUAGES, language_weights=None, max_learning=2, max_teaching=2,
+                     levels=(1, 10), duplicate_rate=0.0, seed=0):
+    rng = random.Random(seed)
+    if language_weights is None:
+        language_weights = [1 / (rank + 1) for rank in range(len(languages))]
+
+    humans = []
+    for idx in range(size):
+        name = 'h{}'.format(idx)
+        if humans and rng.random() < duplicate_rate:
+            original = rng.choice(humans)
+            humans.append(Human(name, list(original.learning_languages), list(original.teaching_languages)))
+            continue
+
+        learning = _weighted_sample(languages, language_weights, rng.randint(1, max_learning), rng)
+        teachable = [(language, weight) for language, weight in zip(languages, language_weights)
+                     if language not in learning]
+        teaching = _weighted_sample([language for language, _ in teachable],
+                                    [weight for _, weight in teachable],
+                                    rng.randint(1, max_teaching), rng)
+        learning_languages = [(language, rng.randint(*levels)) for language in learning]
+        humans.append(Human(name, learning_languages, teaching))
+    return humans
+
+
+def _weighted_sample(population, weights, count, rng):
+    population = list(population)
+    weights = list(weights)
+    sample = []
+    while population and len(sample) < count:
+        idx = rng.choices(range(len(population)), weights)[0]
+        sample.append(population.pop(idx))
+        weights.pop(idx)
+    return sample
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, kinds=tuple(SEATERS), backends=DEFAULT_BACKENDS, max_table_size=3,
+                  max_level_difference=8, language_count=len(LANGUAGES), duplicate_rate=0.0, seed=0,
+                  levels=(1, 10), language_weights=None):
+    missing = {backend for backend in backends if not _backend_available(backend)}
+    results = []
+    for kind in kinds:
+        for backend in backends:
+            for size in sizes:
+                if backend in missing:
+                    results.append({'kind': kind, 'backend': backend, 'size': size, 'skipped': 'not available'})
+                    continue
+                humans = synthetic_roster(size, LANGUAGES[:language_count], language_weights=language_weights,
+                                          levels=levels, duplicate_rate=duplicate_rate, seed=seed)
+                seater = SEATERS[kind][backend](humans, max_table_size, max_level_difference)
+                results.append(_run(seater, kind, backend, size))
+    return {'python': platform.python_version(),
+            'parameters': {'max_table_size': max_table_size,
+                           'max_level_difference': max_level_difference,
+                           'language_count': language_count,
+                           'language_weights': None if language_weights is None else list(language_weights),
+                           'levels': list(levels),
+                           'duplicate_rate': duplicate_rate,
+                           'seed': seed},
+            'results': results}
+
+
+def _backend_available(backend):
+    return backend not in EXTERNAL_BACKENDS or bool(available_solvers([backend]))
+
+
+def _run(seater, kind, backend, size):
+    result = {'kind': kind, 'backend': backend, 'size': size}
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, unseated = seater.seat()
+    except Exception as error:
+        result['error'] = repr(error)
+        return result
+    result['seconds'] = time.perf_counter() - start
+    result['unseated'] = _unseated_count(unseated)
+    result['stats'] = seater.stats.as_dict()
+    return result
+
+
+def _unseated_count(unseated):
+    if isinstance(unseated, tuple):
+        return [len(humans) for humans in unseated]
+    return len(unseated)
+
+
+def regressions(results, baseline, tolerance=1.5):
+    baseline_seconds = {_result_key(result): result['seconds']
+                        for result in baseline['results'] if 'seconds' in result}
+    slower = []
+    for result in results['results']:
+        previous = baseline_seconds.get(_result_key(result))
+        if previous is None or 'seconds' not in result:
+            continue
+        if result['seconds'] > tolerance * previous:
+            slower.append((_result_key(result), previous, result['seconds']))
+    return slower
+
+
+def _result_key(result):
+    return result['kind'], result['backend'], result['size']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the seaters on synthetic rosters.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--kinds', nargs='+', choices=sorted(SEATERS), default=sorted(SEATERS))
+    parser.add_argument('--backends', nargs='+', choices=sorted(SEATERS['symmetric']), default=DEFAULT_BACKENDS)
+    parser.add_argument('--max-table-size', type=int, default=3)
+    parser.add_argument('--max-level-difference', type=int, default=8)
+    parser.add_argument('--languages', type=int, default=len(LANGUAGES))
+    parser.add_argument('--language-weights', type=float, nargs='+')
+    parser.add_argument('--levels', type=int, nargs=2, default=[1, 10], metavar=('MIN', 'MAX'))
+    parser.add_argument('--duplicate-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--baseline')
+    parser.add_argument('--tolerance', type=float, default=1.5)
+    args = parser.parse_args(argv)
+    if args.language_weights is not None and len(args.language_weights) != args.languages:
+        parser.error('--language-weights needs one weight per language')
+
+    results = run_benchmark(args.sizes, args.kinds, args.backends, args.max_table_size,
+                            args.max_level_difference, args.languages, args.duplicate_rate, args.seed,
+                            args.levels, args.language_weights)
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+
+    for result in results['results']:
+        if 'seconds' in result:
+            seconds = '{:.3f}s'.format(result['seconds'])
+        else:
+            seconds = result.get('error') or 'skipped, ' + result['skipped']
+        print('{kind:<12}{backend:<11}{size:>6}  '.format(**result) + seconds)
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as baseline_file:
+        slower = regressions(results, json.load(baseline_file), args.tolerance)
+    for (kind, backend, size), previous, current in slower:
+        print('SLOWER {} {} {}: {:.3f}s -> {:.3f}s'.format(kind, backend, size, previous, current))
+    return 1 if slower else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
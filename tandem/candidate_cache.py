@@ -0,0 +1,99 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+
+class CandidateCache(object):
+
+    def __init__(self, path, max_entries=64):
+        self.path = Path(path)
+        self.max_entries = max_entries
+
+    def candidates(self, seater):
+        fingerprints = [_digest(human.fingerprint()) for human in seater.humans]
+        family_path = self.path / _digest((seater.kind, seater.max_table_size, seater.max_level_difference))
+        entry_path = family_path / (_digest(sorted(fingerprints)) + '.pickle')
+
+        cached = _load(entry_path)
+        if cached is not None:
+            try:
+                os.utime(str(entry_path))
+            except FileNotFoundError:
+                # another worker evicted the entry after we loaded it
+                pass
+            return _decoded_candidates(seater, fingerprints, *cached)[0]
+
+        cached = _load(_latest_entry(family_path))
+        if cached is None:
+            candidates = list(seater._filtered_tables())
+        else:
+            candidates, new_humans = _decoded_candidates(seater, fingerprints, *cached)
+            candidates = seater._extended_candidates(candidates, new_humans)
+
+        self._store(entry_path, seater.humans, fingerprints, candidates)
+        return candidates
+
+    def _store(self, entry_path, humans, fingerprints, candidates):
+        positions = {human: idx for idx, human in enumerate(humans)}
+        encoded = [(tuple(positions[human] for human in table), tuple(sorted(languages)))
+                   for table, languages in candidates]
+
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=str(entry_path.parent), delete=False) as entry_file:
+            pickle.dump((fingerprints, encoded), entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(entry_file.name, str(entry_path))
+        self._evict()
+
+    def _evict(self):
+        entries = sorted(self.path.glob('*/*.pickle'), key=_modified_time)
+        for entry_path in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _decoded_candidates(seater, fingerprints, cached_fingerprints, cached_candidates):
+    available = defaultdict(list)
+    for human, fingerprint in zip(reversed(seater.humans), reversed(fingerprints)):
+        available[fingerprint].append(human)
+
+    humans = {}
+    for idx, fingerprint in enumerate(cached_fingerprints):
+        if available[fingerprint]:
+            humans[idx] = available[fingerprint].pop()
+
+    candidates = [(tuple(sorted((humans[idx] for idx in table), key=seater.positions.get)), frozenset(languages))
+                  for table, languages in cached_candidates
+                  if all(idx in humans for idx in table)]
+    new_humans = [human for remaining in available.values() for human in remaining]
+    return candidates, new_humans
+
+
+def _load(entry_path):
+    if entry_path is None:
+        return None
+    try:
+        with entry_path.open('rb') as entry_file:
+            return pickle.load(entry_file)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _latest_entry(family_path):
+    entries = list(family_path.glob('*.pickle')) if family_path.exists() else []
+    return max(entries, key=_modified_time, default=None)
+
+
+def _modified_time(entry_path):
+    try:
+        return entry_path.stat().st_mtime
+    except FileNotFoundError:
+        return 0
+
+
+def _digest(value):
+    return hashlib.sha1(repr(value).encode('utf8')).hexdigest()
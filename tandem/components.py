@@ -0,0 +1,55 @@
+from tandem.humans import Human
+
+
+def roster_components(humans, possible_tables):
+    parents = {human: human for human in humans}
+
+    for table, _ in possible_tables:
+        root = _find(parents, table[0])
+        for human in table[1:]:
+            other_root = _find(parents, human)
+            if other_root is not root:
+                parents[other_root] = root
+
+    components = {}
+    for human in humans:
+        components.setdefault(_find(parents, human), []).append(human)
+    return list(components.values())
+
+
+def component_tables(components, possible_tables):
+    component_of = {human: idx for idx, component in enumerate(components) for human in component}
+    tables = [[] for _ in components]
+    for language_table in possible_tables:
+        table, _ = language_table
+        tables[component_of[table[0]]].append(language_table)
+    return tables
+
+
+def map_humans(obj, mapping):
+    if isinstance(obj, tuple):
+        return tuple(map_humans(item, mapping) for item in obj)
+    if isinstance(obj, list):
+        return [map_humans(item, mapping) for item in obj]
+    if isinstance(obj, (Human, int)):
+        return mapping[obj]
+    return obj
+
+
+def merged_seatings(seatings):
+    if isinstance(seatings[0], tuple):
+        return tuple(merged_seatings(list(rounds)) for rounds in zip(*seatings))
+    return [table for part in seatings for table in part]
+
+
+def seat_indexed(seater):
+    seatings, _ = seater.seat()
+    positions = {human: idx for idx, human in enumerate(seater.humans)}
+    return map_humans(seatings, positions)
+
+
+def _find(parents, human):
+    while parents[human] is not human:
+        parents[human] = parents[parents[human]]
+        human = parents[human]
+    return human
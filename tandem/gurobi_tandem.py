@@ -1,25 +1,46 @@
 from gurobipy import *
 
 from tandem.base_tandem import Seater
+from tandem.stats import OPTIMAL, FEASIBLE, INFEASIBLE, NOT_SOLVED
 
 
 
 class GurobiMixin(Seater):
+
+    reports_incumbents = True
     
     @classmethod
     def _table_lp_variable(cls, lower_bound, upper_bound, model):
-        def _lp_variable(table):
-            name = cls._hash_table(table)
-            var = model.addVar(name=name,
-                               vtype=GRB.BINARY)
+        def _lp_variable(variable_id):
+            name = cls._variable_name(variable_id)
+            var = model.addVar(lb=lower_bound,
+                               ub=upper_bound,
+                               name=name,
+                               vtype=GRB.INTEGER)
             return var
         return _lp_variable
     
-    @staticmethod
-    def _solve_model(model):
+    def _solve_model(self, model):
         model.update()
-        model.optimize()
+        options = self.solver_options
+        time_left = self._time_left()
+        if options.threads is not None:
+            model.Params.Threads = options.threads
+        if time_left is not None:
+            model.Params.TimeLimit = time_left
+        if options.gap is not None:
+            model.Params.MIPGap = options.gap
+        if options.on_incumbent is None:
+            model.optimize()
+        else:
+            model.optimize(_incumbent_callback(options.on_incumbent))
        
+    @staticmethod
+    def _set_start(variables, start_tables, model):
+        for language_table in start_tables:
+            if language_table in variables:
+                variables[language_table].Start = 1
+
     @staticmethod
     def _update_model(model):
         model.update()
@@ -44,11 +65,48 @@ class GurobiMixin(Seater):
         model.addConstr(constraint, name)
         return model
 
+    @staticmethod
+    def _variable_value(var, model):
+        if GurobiMixin._model_status(model) not in (OPTIMAL, FEASIBLE):
+            return None
+        try:
+            return var.x
+        except GurobiError:
+            return None
+
+    @staticmethod
+    def _model_status(model):
+        if model.Status == GRB.OPTIMAL:
+            return OPTIMAL
+        if model.Status in (GRB.INFEASIBLE, GRB.INF_OR_UNBD):
+            return INFEASIBLE
+        if model.SolCount > 0:
+            return FEASIBLE
+        return NOT_SOLVED
+
+    @staticmethod
+    def _objective_value(model):
+        return model.ObjVal
+
+    @staticmethod
+    def _model_size(model):
+        model.update()
+        return model.NumVars, model.NumConstrs, model.NumNZs
+
     @staticmethod
     def _chosen_tables(variables, model):
+        if GurobiMixin._model_status(model) not in (OPTIMAL, FEASIBLE):
+            return
         for language_table, var in variables.items():
             try:
                 if var.x == 1.0:
                     yield language_table
             except GurobiError:
-                pass
+                pass
+
+
+def _incumbent_callback(on_incumbent):
+    def _callback(model, where):
+        if where == GRB.Callback.MIPSOL:
+            on_incumbent(model.cbGet(GRB.Callback.MIPSOL_OBJ))
+    return _callback
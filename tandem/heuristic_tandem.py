@@ -0,0 +1,24 @@
+from tandem.highs_tandem import SparseModelMixin
+from tandem.local_search import packing_solution
+from tandem.stats import FEASIBLE, NOT_SOLVED
+
+
+class HeuristicMixin(SparseModelMixin):
+
+    reports_incumbents = True
+
+    def __init__(self, *args, time_budget=1.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.time_budget = time_budget
+
+    def _solve_model(self, model):
+        time_budget = self.time_budget
+        time_left = self._time_left()
+        if time_left is not None:
+            time_budget = min(time_budget, time_left)
+        model.solution, model.status = packing_solution(model, time_budget,
+                                                        on_improvement=self.solver_options.on_incumbent)
+
+    @staticmethod
+    def _model_status(model):
+        return FEASIBLE if model.status else NOT_SOLVED
@@ -0,0 +1,93 @@
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from tandem.base_tandem import Seater
+from tandem.sparse_model import SparseModel, sparse_sum
+from tandem.stats import OPTIMAL, FEASIBLE, INFEASIBLE, NOT_SOLVED
+
+
+class SparseModelMixin(Seater):
+
+    @classmethod
+    def _table_lp_variable(cls, lower_bound, upper_bound, model):
+        def _lp_variable(variable_id):
+            return model.add_variable(lower_bound, upper_bound)
+        return _lp_variable
+
+    @staticmethod
+    def _update_model(model):
+        pass
+
+    @staticmethod
+    def _create_minimize_model(name):
+        return SparseModel(name)
+
+    @staticmethod
+    def _solver_sum(iterable):
+        return sparse_sum(iterable)
+
+    @staticmethod
+    def _add_objective_function(objective, model):
+        model.set_objective(objective)
+        return model
+
+    @staticmethod
+    def _add_constraint(constraint, name, model):
+        model.add_constraint(constraint, name)
+        return model
+
+    @staticmethod
+    def _variable_value(var, model):
+        if model.solution is None:
+            return None
+        return model.solution[var.index]
+
+    @staticmethod
+    def _objective_value(model):
+        return model.objective_value()
+
+    @staticmethod
+    def _model_size(model):
+        return model.variable_count, model.row_count, model.nonzero_count
+
+    @staticmethod
+    def _chosen_tables(variables, model):
+        if model.solution is None:
+            return
+        for language_table, var in variables.items():
+            if round(model.solution[var.index]) == 1:
+                yield language_table
+
+
+class HighsMixin(SparseModelMixin):
+
+    def _solve_model(self, model):
+        options = {'time_limit': self._time_left(), 'mip_rel_gap': self.solver_options.gap}
+        model.solution = _solve_with_highs(model, {name: value for name, value in options.items()
+                                                   if value is not None})
+
+    @staticmethod
+    def _model_status(model):
+        if model.status == 0:
+            return OPTIMAL
+        if model.status == 2:
+            return INFEASIBLE
+        return FEASIBLE if model.solution is not None else NOT_SOLVED
+
+
+def _solve_with_highs(model, options=None):
+    if not model.variable_count:
+        model.status = 0 if model.trivially_feasible() else 2
+        return np.zeros(0) if model.status == 0 else None
+
+    constraints = ()
+    if model.row_count:
+        constraints = LinearConstraint(model.constraint_matrix(), model.row_lower, model.row_upper)
+
+    result = milp(model.objective_vector(),
+                  integrality=np.ones(model.variable_count),
+                  bounds=Bounds(model.lower_bounds, model.upper_bounds),
+                  constraints=constraints,
+                  options=options)
+    model.status = result.status
+    return result.x
@@ -8,6 +8,10 @@ class Human(object):
     def __repr__(self):
         return self.name
 
+    def fingerprint(self):
+        learning_languages = tuple((language, str(level)) for language, level in self.learning_languages)
+        return self.name, learning_languages, tuple(self.teaching_languages)
+
     def all_languages(self):
         learning_languages = [language_with_level[0] for language_with_level in self.learning_languages]
         return set(self.teaching_languages + learning_languages)
@@ -18,3 +22,74 @@ class Human(object):
         return {'Name': self.name,
                 'Learning Languages': learning_languages,
                 'Teaching Languages': teaching_languages}
+
+
+class LanguageTable(object):
+    __slots__ = ('ids', 'names', '_combinations')
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self._combinations = {}
+
+    def id(self, language):
+        try:
+            return self.ids[language]
+        except KeyError:
+            language_id = self.ids[language] = len(self.names)
+            self.names.append(language)
+            return language_id
+
+    def mask(self, languages):
+        mask = 0
+        for language in languages:
+            mask |= 1 << self.id(language)
+        return mask
+
+    def combination(self, mask):
+        try:
+            return self._combinations[mask]
+        except KeyError:
+            combination = frozenset(self.names[language_id] for language_id in language_ids(mask))
+            self._combinations[mask] = combination
+            return combination
+
+
+class Profile(object):
+    __slots__ = ('human', 'teaching', 'learning', 'languages', 'learning_ids', 'levels', 'combinations')
+
+    def __init__(self, human, language_table):
+        self.human = human
+        self.learning_ids = tuple(language_table.id(language) for language, _ in human.learning_languages)
+        self.levels = tuple(int(level) for _, level in human.learning_languages)
+        teaching_ids = [language_table.id(language) for language in human.teaching_languages]
+
+        self.teaching = _ids_mask(teaching_ids)
+        self.learning = _ids_mask(self.learning_ids)
+        self.languages = self.teaching | self.learning
+        self.combinations = frozenset((1 << learning_id) | (1 << teaching_id)
+                                      for learning_id in self.learning_ids
+                                      for teaching_id in teaching_ids)
+
+    def __repr__(self):
+        return repr(self.human)
+
+    def first_learning(self, mask):
+        for rank, language_id in enumerate(self.learning_ids):
+            if mask >> language_id & 1:
+                return rank, self.levels[rank]
+        return None
+
+
+def language_ids(mask):
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+def _ids_mask(ids):
+    mask = 0
+    for language_id in ids:
+        mask |= 1 << language_id
+    return mask
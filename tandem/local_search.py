@@ -0,0 +1,147 @@
+import random
+import time
+
+import numpy as np
+
+
+MAX_STALE_ITERATIONS = 2000
+
+
+def packing_solution(model, time_budget, seed=0, on_improvement=None):
+    packing = _Packing(model)
+    rng = random.Random(seed)
+
+    current = packing.greedy(range(model.variable_count), rng=None)
+    best = current.copy()
+    if on_improvement is not None:
+        on_improvement(best.cost)
+
+    deadline = time.monotonic() + time_budget
+    stale_iterations = 0
+    while stale_iterations < MAX_STALE_ITERATIONS and time.monotonic() < deadline:
+        stale_iterations += 1
+        trial = current.copy()
+        if trial.chosen and rng.random() < 0.5:
+            freed_rows = packing.move(trial, rng)
+        else:
+            freed_rows = packing.swap(trial, rng)
+        if freed_rows is None:
+            continue
+        packing.repair(trial, freed_rows, rng)
+
+        if trial.score() <= current.score():
+            current = trial
+        if current.score() < best.score():
+            best = current.copy()
+            stale_iterations = 0
+            if on_improvement is not None:
+                on_improvement(best.cost)
+
+    solution = np.zeros(model.variable_count)
+    solution[sorted(best.chosen)] = 1
+    return solution, best.uncovered == 0
+
+
+class _State(object):
+    __slots__ = ('chosen', 'loads', 'cost', 'uncovered')
+
+    def __init__(self, chosen, loads, cost, uncovered):
+        self.chosen = chosen
+        self.loads = loads
+        self.cost = cost
+        self.uncovered = uncovered
+
+    def copy(self):
+        return _State(set(self.chosen), list(self.loads), self.cost, self.uncovered)
+
+    def score(self):
+        return self.uncovered, self.cost
+
+
+class _Packing(object):
+
+    def __init__(self, model):
+        self.costs = model.objective_vector().tolist()
+        self.lower = list(model.row_lower)
+        self.upper = list(model.row_upper)
+        self.columns = [[] for _ in range(model.variable_count)]
+        self.row_columns = [[] for _ in range(model.row_count)]
+
+        for row in range(model.row_count):
+            for idx in range(model.row_starts[row], model.row_starts[row + 1]):
+                column = model.row_indices[idx]
+                self.columns[column].append((row, model.row_values[idx]))
+                self.row_columns[row].append(column)
+
+        self.usable = [all(value <= self.upper[row] for row, value in column) for column in self.columns]
+        self.required = [sum(1 for row, _ in column if self.lower[row] > 0) for column in self.columns]
+
+    def empty_state(self):
+        uncovered = sum(1 for lower in self.lower if lower > 0)
+        return _State(set(), [0.0] * len(self.lower), 0.0, uncovered)
+
+    def fits(self, state, column):
+        loads = state.loads
+        return all(loads[row] + value <= self.upper[row] for row, value in self.columns[column])
+
+    def add(self, state, column):
+        for row, value in self.columns[column]:
+            was_covered = state.loads[row] >= self.lower[row]
+            state.loads[row] += value
+            if not was_covered and state.loads[row] >= self.lower[row]:
+                state.uncovered -= 1
+        state.chosen.add(column)
+        state.cost += self.costs[column]
+
+    def remove(self, state, column):
+        for row, value in self.columns[column]:
+            was_covered = state.loads[row] >= self.lower[row]
+            state.loads[row] -= value
+            if was_covered and state.loads[row] < self.lower[row]:
+                state.uncovered += 1
+        state.chosen.discard(column)
+        state.cost -= self.costs[column]
+
+    def greedy(self, columns, rng, state=None):
+        if state is None:
+            state = self.empty_state()
+        for column in self._ordered(columns, rng):
+            if self.fits(state, column):
+                self.add(state, column)
+        return state
+
+    def move(self, state, rng):
+        column = rng.choice(sorted(state.chosen))
+        self.remove(state, column)
+        return [row for row, _ in self.columns[column]]
+
+    def swap(self, state, rng):
+        open_rows = [row for row, load in enumerate(state.loads) if load < self.lower[row]]
+        if open_rows:
+            candidates = self.row_columns[rng.choice(open_rows)]
+        else:
+            candidates = range(len(self.columns))
+        candidates = [column for column in candidates if self.usable[column] and column not in state.chosen]
+        if not candidates:
+            return None
+
+        column = rng.choice(candidates)
+        rows = {row for row, _ in self.columns[column]}
+        freed_rows = set()
+        for other in [other for other in state.chosen if rows.intersection(r for r, _ in self.columns[other])]:
+            self.remove(state, other)
+            freed_rows.update(row for row, _ in self.columns[other])
+        self.add(state, column)
+        return freed_rows - rows
+
+    def repair(self, state, freed_rows, rng):
+        open_rows = set(freed_rows)
+        open_rows.update(row for row, load in enumerate(state.loads) if load < self.lower[row])
+        candidates = {column for row in open_rows for column in self.row_columns[row]}
+        self.greedy(candidates - state.chosen, rng, state)
+
+    def _ordered(self, columns, rng):
+        def ratio(column):
+            noise = rng.random() if rng is not None else 0.0
+            return (self.costs[column] + noise) / max(1, self.required[column])
+        return sorted((column for column in columns if self.usable[column]), key=ratio)
@@ -0,0 +1,86 @@
+from collections import defaultdict
+
+from tandem.humans import Human
+
+
+PAYLOAD_VERSION = 1
+
+
+def seating_request(seater_class, humans, max_table_size, max_level_difference):
+    languages = {}
+    roster = []
+    for human in humans:
+        learning = [[languages.setdefault(language, len(languages)), level]
+                    for language, level in human.learning_languages]
+        teaching = [languages.setdefault(language, len(languages)) for language in human.teaching_languages]
+        roster.append([human.name, learning, teaching])
+
+    return {'version': PAYLOAD_VERSION,
+            'seater': seater_class.__name__,
+            'max_table_size': max_table_size,
+            'max_level_difference': max_level_difference,
+            'languages': list(languages),
+            'roster': roster}
+
+
+def decode_roster(payload):
+    _check_version(payload)
+    languages = payload['languages']
+    return [Human(name,
+                  [(languages[language], level) for language, level in learning],
+                  [languages[language] for language in teaching])
+            for name, learning, teaching in payload['roster']]
+
+
+def seater_from_request(payload, seater_classes, **kwargs):
+    seater_class = seater_classes[payload['seater']]
+    return seater_class(decode_roster(payload),
+                        max_table_size=payload['max_table_size'],
+                        max_level_difference=payload['max_level_difference'],
+                        **kwargs)
+
+
+def roster_positions(humans, roster):
+    indices = defaultdict(list)
+    for idx, human in enumerate(roster):
+        indices[human.fingerprint()].append(idx)
+    for same_humans in indices.values():
+        same_humans.reverse()
+    return {human: indices[human.fingerprint()].pop() for human in humans}
+
+
+def encode_seatings(seatings, unseated, positions, request=None):
+    if isinstance(unseated, tuple):
+        rounds = seatings
+        unseated_rounds = unseated
+    else:
+        rounds = (seatings,)
+        unseated_rounds = (unseated,)
+
+    payload = {'version': PAYLOAD_VERSION,
+               'rounds': [[[[positions[human] for human in table], sorted(languages)] for table, languages in tables]
+                          for tables in rounds],
+               'unseated': [[positions[human] for human in round_unseated] for round_unseated in unseated_rounds]}
+    if request is not None:
+        payload['languages'] = request['languages']
+        payload['roster'] = request['roster']
+    return payload
+
+
+def decode_seatings(payload, humans):
+    _check_version(payload)
+    rounds = [[(tuple(humans[idx] for idx in table), frozenset(languages)) for table, languages in tables]
+              for tables in payload['rounds']]
+    unseated = [[humans[idx] for idx in round_unseated] for round_unseated in payload['unseated']]
+    if len(rounds) == 1:
+        return rounds[0], unseated[0]
+    return tuple(rounds), tuple(unseated)
+
+
+def decode_result(payload):
+    return decode_seatings(payload, decode_roster(payload))
+
+
+def _check_version(payload):
+    if payload.get('version') != PAYLOAD_VERSION:
+        raise ValueError('Unsupported payload version: {!r}'.format(payload.get('version')))
@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import queue
+import shutil
+import signal
+import tempfile
+import time
+
+import pulp
+
+from scip.pulp_scip import SCIP_CMD
+from tandem.pulp_tandem import PulpMixin
+
+
+# older PuLP releases ship no HiGHS command, so it only joins the portfolio when present
+SOLVERS = {name: solver for name, solver in (('cbc', pulp.PULP_CBC_CMD),
+                                             ('gurobi', pulp.GUROBI),
+                                             ('scip', SCIP_CMD),
+                                             ('highs', getattr(pulp, 'HiGHS', None)))
+           if solver is not None}
+
+# time the parent keeps waiting after the deadline for racers to report their incumbents
+REPORT_GRACE = 2.0
+# how often the parent checks whether racers died without reporting
+POLL_INTERVAL = 0.1
+
+
+class PortfolioMixin(PulpMixin):
+
+    def __init__(self, *args, portfolio=tuple(SOLVERS), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.portfolio = portfolio
+        self.portfolio_winner = None
+
+    def _solve_model(self, model):
+        options = self.solver_options.pulp_options()
+        self.portfolio_winner = race(model, available_solvers(self.portfolio), self._time_left(), **options)
+
+
+def available_solvers(names):
+    return [name for name in names if name in SOLVERS and SOLVERS[name](msg=False).available()]
+
+
+def race(model, solvers, deadline=None, **solver_options):
+    if not solvers:
+        raise pulp.PulpSolverError('No solver of the portfolio is available')
+
+    end = None if deadline is None else time.monotonic() + deadline
+    tmp_dir = tempfile.mkdtemp(prefix='tandem-portfolio-')
+    context = multiprocessing.get_context()
+    results = context.Queue()
+    processes = {}
+    try:
+        mps_path = os.path.join(tmp_dir, 'model.mps')
+        model.writeMPS(mps_path)
+        for name in solvers:
+            process = context.Process(target=_solve_file, args=(name, mps_path, end, solver_options, results), daemon=True)
+            process.start()
+            processes[name] = process
+        winner, status, sol_status, values = _first_optimum(results, processes, end)
+    finally:
+        for process in processes.values():
+            _kill(process)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    all_values = dict.fromkeys((var.name for var in model.variables()), 0.0)
+    all_values.update(values)
+    model.assignVarsVals(all_values)
+    model.assignStatus(status, sol_status)
+    return winner
+
+
+def _first_optimum(results, processes, end):
+    racing = dict(processes)
+    best = None
+    exited = False
+    while racing:
+        try:
+            name, status, sol_status, objective, values = results.get(timeout=_poll_timeout(end))
+        except queue.Empty:
+            if end is not None and time.monotonic() >= end + REPORT_GRACE or exited:
+                break
+            # poll once more after the last racer exits so a report still in the pipe is read
+            exited = all(process.exitcode is not None for process in racing.values())
+            continue
+        racing.pop(name, None)
+        if sol_status == pulp.LpSolutionOptimal:
+            return name, status, sol_status, values
+        if sol_status == pulp.LpSolutionIntegerFeasible and (best is None or objective < best[0]):
+            best = objective, name, status, sol_status, values
+    if best is None:
+        return None, pulp.LpStatusNotSolved, pulp.LpSolutionNoSolutionFound, {}
+    return best[1:]
+
+
+def _poll_timeout(end):
+    if end is None:
+        return POLL_INTERVAL
+    return min(POLL_INTERVAL, max(end + REPORT_GRACE - time.monotonic(), 0))
+
+
+def _solve_file(name, mps_path, end, solver_options, results):
+    if hasattr(os, 'setsid'):
+        os.setsid()
+    try:
+        variables, model = pulp.LpProblem.fromMPS(mps_path)
+        time_limit = None if end is None else max(end - time.monotonic(), 0)
+        model.solve(SOLVERS[name](msg=False, timeLimit=time_limit, **solver_options))
+        values = {var_name: var.value() for var_name, var in variables.items() if var.value()}
+        results.put((name, model.status, model.sol_status, model.objective.value(), values))
+    except Exception:
+        results.put((name, pulp.LpStatusNotSolved, pulp.LpSolutionNoSolutionFound, None, {}))
+
+
+def _kill(process):
+    if process.is_alive():
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.terminate()
+    process.join()
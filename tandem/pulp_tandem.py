@@ -1,6 +1,7 @@
 import pulp
 
 from tandem.base_tandem import Seater
+from tandem.stats import OPTIMAL, FEASIBLE, INFEASIBLE, NOT_SOLVED
 
 
 
@@ -8,17 +9,23 @@ class PulpMixin(Seater):
     
     @classmethod
     def _table_lp_variable(cls, lower_bound, upper_bound, model):
-        def _lp_variable(table):
-            name = cls._hash_table(table)
+        def _lp_variable(variable_id):
+            name = cls._variable_name(variable_id)
             return pulp.LpVariable(name,
                                    lowBound=lower_bound,
                                    upBound=upper_bound,
                                    cat=pulp.LpInteger)
         return _lp_variable 
     
+    def _solve_model(self, model):
+        options = self.solver_options.pulp_options(self._time_left())
+        model.solve(pulp.PULP_CBC_CMD(warmStart=bool(self.start_tables), **options))
+
     @staticmethod
-    def _solve_model(model):
-        model.solve()
+    def _set_start(variables, start_tables, model):
+        for language_table in start_tables:
+            if language_table in variables:
+                variables[language_table].setInitialValue(1)
         
     @staticmethod
     def _update_model(model):
@@ -42,8 +49,32 @@ class PulpMixin(Seater):
         model += (constraint, name)
         return model
     
+    @staticmethod
+    def _variable_value(var, model):
+        return var.value()
+
+    @staticmethod
+    def _model_status(model):
+        return _STATUSES.get(model.sol_status, NOT_SOLVED)
+
+    @staticmethod
+    def _objective_value(model):
+        return pulp.value(model.objective)
+
+    @staticmethod
+    def _model_size(model):
+        constraints = model.constraints.values()
+        return len(model.variables()), len(constraints), sum(len(constraint) for constraint in constraints)
+
     @staticmethod
     def _chosen_tables(variables, model):
+        if PulpMixin._model_status(model) not in (OPTIMAL, FEASIBLE):
+            return
         for language_table, var in variables.items():
             if var.value() == 1.0:
-                yield language_table
\ No newline at end of file
+                yield language_table
+
+
+_STATUSES = {pulp.LpSolutionOptimal: OPTIMAL,
+             pulp.LpSolutionIntegerFeasible: FEASIBLE,
+             pulp.LpSolutionInfeasible: INFEASIBLE}
@@ -0,0 +1,29 @@
+from tandem.symmetric_tandem import (SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater,
+                                     SymmetricHeuristicSeater, SymmetricScipSeater,
+                                     SymmetricPortfolioSeater)
+from tandem.asymmetric_tandem import (AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater,
+                                      AsymmetricHeuristicSeater, AsymmetricScipSeater,
+                                      AsymmetricPortfolioSeater)
+from tandem.suboptimal_tandem import (SuboptimalPulpSeater, SuboptimalGurobiSeater, SuboptimalHighsSeater,
+                                      SuboptimalHeuristicSeater, SuboptimalScipSeater,
+                                      SuboptimalPortfolioSeater)
+
+
+SEATERS = {'symmetric': {'pulp': SymmetricPulpSeater,
+                         'gurobi': SymmetricGurobiSeater,
+                         'highs': SymmetricHighsSeater,
+                         'heuristic': SymmetricHeuristicSeater,
+                         'scip': SymmetricScipSeater,
+                         'portfolio': SymmetricPortfolioSeater},
+           'asymmetric': {'pulp': AsymmetricPulpSeater,
+                          'gurobi': AsymmetricGurobiSeater,
+                          'highs': AsymmetricHighsSeater,
+                          'heuristic': AsymmetricHeuristicSeater,
+                          'scip': AsymmetricScipSeater,
+                          'portfolio': AsymmetricPortfolioSeater},
+           'suboptimal': {'pulp': SuboptimalPulpSeater,
+                          'gurobi': SuboptimalGurobiSeater,
+                          'highs': SuboptimalHighsSeater,
+                          'heuristic': SuboptimalHeuristicSeater,
+                          'scip': SuboptimalScipSeater,
+                          'portfolio': SuboptimalPortfolioSeater}}
@@ -0,0 +1,44 @@
+import hashlib
+from collections import OrderedDict
+
+
+class ResultCache(object):
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        try:
+            self.entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self.entries[key]
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def seating_key(seater_class, humans, max_table_size, max_level_difference):
+    return seater_class.__name__, max_table_size, max_level_difference, roster_digest(humans)
+
+
+def roster_digest(humans):
+    fingerprints = sorted(repr(human.fingerprint()) for human in humans)
+    sha = hashlib.sha1()
+    for fingerprint in fingerprints:
+        sha.update(fingerprint.encode('utf8'))
+        sha.update(b'\n')
+    return sha.hexdigest()
@@ -0,0 +1,81 @@
+import json
+import sqlite3
+import threading
+
+from tandem.humans import Human
+
+
+class RosterStore(object):
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS humans ('
+                                     'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                                     'name TEXT NOT NULL UNIQUE, '
+                                     'learning TEXT NOT NULL, '
+                                     'teaching TEXT NOT NULL)')
+        self._humans = {}
+        for name, learning, teaching in self._connection.execute('SELECT name, learning, teaching '
+                                                                 'FROM humans ORDER BY id'):
+            self._humans[name] = _decoded_human(name, learning, teaching)
+
+    def __len__(self):
+        return len(self._humans)
+
+    def __contains__(self, name):
+        return name in self._humans
+
+    def __iter__(self):
+        return iter(list(self._humans.values()))
+
+    def get(self, name):
+        return self._humans.get(name)
+
+    def humans(self):
+        return list(self._humans.values())
+
+    def add(self, human):
+        if self.add_many([human]):
+            raise ValueError('{} is already in the roster'.format(human.name))
+
+    def add_many(self, humans):
+        added = {}
+        clashing = []
+        with self._lock, self._connection:
+            for human in humans:
+                if human.name in self._humans or human.name in added:
+                    clashing.append(human)
+                else:
+                    added[human.name] = human
+            self._connection.executemany('INSERT INTO humans (name, learning, teaching) VALUES (?, ?, ?)',
+                                         (_encoded_human(human) for human in added.values()))
+            self._humans.update(added)
+        return clashing
+
+    def remove(self, name):
+        with self._lock, self._connection:
+            if self._humans.pop(name, None) is None:
+                return False
+            self._connection.execute('DELETE FROM humans WHERE name = ?', (name,))
+        return True
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM humans')
+            self._humans.clear()
+
+    def close(self):
+        self._connection.close()
+
+
+def _encoded_human(human):
+    learning = json.dumps([list(language_with_level) for language_with_level in human.learning_languages])
+    return human.name, learning, json.dumps(list(human.teaching_languages))
+
+
+def _decoded_human(name, learning, teaching):
+    learning_languages = [tuple(language_with_level) for language_with_level in json.loads(learning)]
+    return Human(name, learning_languages, json.loads(teaching))
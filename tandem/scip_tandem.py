@@ -0,0 +1,9 @@
+from scip.pulp_scip import SCIP_CMD
+from tandem.pulp_tandem import PulpMixin
+
+
+class ScipMixin(PulpMixin):
+
+    def _solve_model(self, model):
+        options = self.solver_options.pulp_options(self._time_left())
+        model.solve(SCIP_CMD(warmStart=bool(self.start_tables), **options))
@@ -0,0 +1,57 @@
+from collections import namedtuple
+
+import numpy as np
+
+
+TableMatrices = namedtuple('TableMatrices', ['ranks', 'levels', 'learning', 'teaching', 'members', 'sizes'])
+
+
+def table_matrices(profile_tables, positions):
+    width = max((len(profiles) for profiles, _ in profile_tables), default=0)
+    shape = (len(profile_tables), width)
+    ranks = np.zeros(shape)
+    levels = np.zeros(shape)
+    learning = np.zeros(shape, dtype=bool)
+    teaching = np.zeros(shape, dtype=bool)
+    members = np.full(shape, -1, dtype=np.intp)
+    sizes = np.zeros(len(profile_tables))
+
+    for row, (profiles, mask) in enumerate(profile_tables):
+        sizes[row] = len(profiles)
+        for column, profile in enumerate(profiles):
+            members[row, column] = positions[profile.human]
+            teaching[row, column] = bool(profile.teaching & mask)
+            first_learning = profile.first_learning(mask)
+            if first_learning is not None:
+                ranks[row, column], levels[row, column] = first_learning
+                learning[row, column] = True
+
+    return TableMatrices(ranks, levels, learning, teaching, members, sizes)
+
+
+def ranking_unhappiness(matrices):
+    return np.where(matrices.learning, matrices.ranks, 0).sum(axis=1)
+
+
+def level_unhappiness(matrices):
+    learning = matrices.learning
+    counts = np.maximum(learning.sum(axis=1), 1)
+
+    maximum = np.where(learning, matrices.levels, -np.inf).max(axis=1, initial=-np.inf)
+    scale = np.where(np.isfinite(maximum) & (maximum != 0), maximum, 1)
+    normalized = np.where(learning, matrices.levels / scale[:, np.newaxis], 0)
+
+    mean = normalized.sum(axis=1) / counts
+    deviations = np.where(learning, normalized - mean[:, np.newaxis], 0)
+    return np.sqrt((deviations ** 2).sum(axis=1) / counts)
+
+
+def size_unhappiness(matrices):
+    return 0.01 * matrices.sizes ** 2
+
+
+def repeated_roles(matrices, already_teacher, already_pupil):
+    seated = matrices.members >= 0
+    members = np.where(seated, matrices.members, 0)
+    repeated = np.where(matrices.teaching, already_teacher[members], already_pupil[members])
+    return (repeated & seated).sum(axis=1)
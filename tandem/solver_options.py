@@ -0,0 +1,23 @@
+import time
+
+
+class SolverOptions(object):
+
+    def __init__(self, threads=None, time_limit=None, gap=None, on_incumbent=None):
+        self.threads = threads
+        self.time_limit = time_limit
+        self.gap = gap
+        self.on_incumbent = on_incumbent
+
+    def __repr__(self):
+        return 'SolverOptions(threads={!r}, time_limit={!r}, gap={!r})'.format(self.threads, self.time_limit,
+                                                                                 self.gap)
+
+    def deadline(self):
+        if self.time_limit is None:
+            return None
+        return time.monotonic() + self.time_limit
+
+    def pulp_options(self, time_left=None):
+        options = {'threads': self.threads, 'timeLimit': time_left, 'gapRel': self.gap}
+        return {name: value for name, value in options.items() if value is not None}
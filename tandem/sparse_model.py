@@ -0,0 +1,165 @@
+from array import array
+
+import numpy as np
+from scipy.sparse import csr_array
+
+
+class SparseVariable(object):
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __repr__(self):
+        return 'x{}'.format(self.index)
+
+    def _expression(self):
+        return SparseExpression({self.index: 1.0})
+
+    def __add__(self, other):
+        return self._expression() + other
+
+    __radd__ = __add__
+
+    def __mul__(self, factor):
+        return SparseExpression({self.index: float(factor)})
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return self._expression() == other
+
+    def __le__(self, other):
+        return self._expression() <= other
+
+    def __ge__(self, other):
+        return self._expression() >= other
+
+    __hash__ = object.__hash__
+
+
+class SparseExpression(object):
+    __slots__ = ('terms', 'constant')
+
+    def __init__(self, terms=None, constant=0.0):
+        self.terms = terms if terms is not None else {}
+        self.constant = constant
+
+    def add(self, other, factor=1.0):
+        terms = self.terms
+        if isinstance(other, SparseVariable):
+            terms[other.index] = terms.get(other.index, 0.0) + factor
+        elif isinstance(other, SparseExpression):
+            for index, value in other.terms.items():
+                terms[index] = terms.get(index, 0.0) + factor * value
+            self.constant += factor * other.constant
+        else:
+            self.constant += factor * other
+        return self
+
+    def __add__(self, other):
+        return SparseExpression(dict(self.terms), self.constant).add(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return SparseExpression(dict(self.terms), self.constant).add(other, -1.0)
+
+    def __mul__(self, factor):
+        factor = float(factor)
+        terms = {index: factor * value for index, value in self.terms.items()}
+        return SparseExpression(terms, factor * self.constant)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return SparseConstraint(self, other - self.constant, other - self.constant)
+
+    def __le__(self, other):
+        return SparseConstraint(self, -np.inf, other - self.constant)
+
+    def __ge__(self, other):
+        return SparseConstraint(self, other - self.constant, np.inf)
+
+    __hash__ = None
+
+
+class SparseConstraint(object):
+    __slots__ = ('expression', 'lower', 'upper')
+
+    def __init__(self, expression, lower, upper):
+        self.expression = expression
+        self.lower = lower
+        self.upper = upper
+
+
+class SparseModel(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.lower_bounds = []
+        self.upper_bounds = []
+        self.objective = SparseExpression()
+        self.row_names = []
+        self.row_lower = []
+        self.row_upper = []
+        self.row_indices = array('q')
+        self.row_values = array('d')
+        self.row_starts = array('q', [0])
+        self.solution = None
+        self.status = None
+
+    @property
+    def variable_count(self):
+        return len(self.lower_bounds)
+
+    @property
+    def row_count(self):
+        return len(self.row_names)
+
+    @property
+    def nonzero_count(self):
+        return len(self.row_indices)
+
+    def add_variable(self, lower_bound, upper_bound):
+        self.lower_bounds.append(lower_bound)
+        self.upper_bounds.append(upper_bound)
+        return SparseVariable(len(self.lower_bounds) - 1)
+
+    def set_objective(self, objective):
+        self.objective = SparseExpression().add(objective)
+
+    def add_constraint(self, constraint, name):
+        terms = constraint.expression.terms
+        self.row_indices.extend(terms.keys())
+        self.row_values.extend(terms.values())
+        self.row_starts.append(len(self.row_indices))
+        self.row_lower.append(constraint.lower)
+        self.row_upper.append(constraint.upper)
+        self.row_names.append(name)
+
+    def objective_vector(self):
+        objective = np.zeros(self.variable_count)
+        for index, value in self.objective.terms.items():
+            objective[index] = value
+        return objective
+
+    def objective_value(self):
+        return self.objective.constant + sum(value * self.solution[index]
+                                             for index, value in self.objective.terms.items())
+
+    def constraint_matrix(self):
+        return csr_array((np.array(self.row_values, dtype=float),
+                          np.array(self.row_indices, dtype=np.intp),
+                          np.array(self.row_starts, dtype=np.intp)),
+                         shape=(self.row_count, self.variable_count))
+
+    def trivially_feasible(self):
+        return all(lower <= 0 <= upper for lower, upper in zip(self.row_lower, self.row_upper))
+
+
+def sparse_sum(iterable):
+    expression = SparseExpression()
+    for item in iterable:
+        expression.add(item)
+    return expression
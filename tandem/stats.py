@@ -0,0 +1,116 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+OPTIMAL = 'optimal'
+FEASIBLE = 'feasible'
+INFEASIBLE = 'infeasible'
+NOT_SOLVED = 'not solved'
+
+
+class StageStats(object):
+    __slots__ = ('name', 'seconds', 'peak_memory', 'counts', 'status')
+
+    def __init__(self, name, counts=None):
+        self.name = name
+        self.seconds = 0.0
+        self.peak_memory = None
+        self.counts = dict(counts or {})
+        self.status = None
+
+    def __repr__(self):
+        return 'StageStats({!r}, {:.3f}s)'.format(self.name, self.seconds)
+
+    def as_dict(self):
+        return {'name': self.name,
+                'seconds': self.seconds,
+                'peak_memory': self.peak_memory,
+                'counts': dict(self.counts),
+                'status': self.status}
+
+
+class SeatingStats(object):
+
+    def __init__(self, on_stage=None, trace_memory=False):
+        self.on_stage = on_stage
+        self.trace_memory = trace_memory
+        self.stages = []
+        self._inner_seconds = 0.0
+        self._open_peaks = []
+
+    @property
+    def seconds(self):
+        return sum(stage.seconds for stage in self.stages)
+
+    @property
+    def status(self):
+        statuses = [stage.status for stage in self.stages if stage.status is not None]
+        return statuses[-1] if statuses else None
+
+    def totals(self):
+        totals = {}
+        for stage in self.stages:
+            totals[stage.name] = totals.get(stage.name, 0.0) + stage.seconds
+        return totals
+
+    def as_dict(self):
+        return {'seconds': self.seconds,
+                'status': self.status,
+                'stages': [stage.as_dict() for stage in self.stages]}
+
+    @contextmanager
+    def stage(self, name, **counts):
+        stage = StageStats(name, counts)
+        started_tracing = self._start_tracing()
+        inner_seconds = self._inner_seconds
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            elapsed = time.perf_counter() - start
+            stage.seconds = elapsed - (self._inner_seconds - inner_seconds)
+            self._inner_seconds = inner_seconds
+            if self.trace_memory:
+                stage.peak_memory = max(self._open_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._open_peaks:
+                    self._open_peaks[-1] = max(self._open_peaks[-1], stage.peak_memory)
+                if started_tracing:
+                    tracemalloc.stop()
+            self._record(stage)
+
+    def iterate(self, name, iterable, counter=None):
+        counter = counter or name
+        stage = StageStats(name, {counter: 0})
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                stage.seconds += time.perf_counter() - start
+            stage.counts[counter] += 1
+            yield item
+        self._inner_seconds += stage.seconds
+        self._record(stage)
+
+    def _start_tracing(self):
+        if not self.trace_memory:
+            return False
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        else:
+            # the peak is shared, so keep what the enclosing stage has seen before resetting it
+            if self._open_peaks:
+                self._open_peaks[-1] = max(self._open_peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._open_peaks.append(0)
+        return started_tracing
+
+    def _record(self, stage):
+        self.stages.append(stage)
+        if self.on_stage is not None:
+            self.on_stage(stage)
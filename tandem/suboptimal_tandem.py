@@ -3,37 +3,53 @@ from itertools import product
 import numpy as np
 
 from tandem.base_tandem import HUMANS, Seater
+from tandem.scoring import ranking_unhappiness, level_unhappiness, repeated_roles
 from tandem.pulp_tandem import PulpMixin
 from tandem.gurobi_tandem import GurobiMixin
+from tandem.highs_tandem import HighsMixin
+from tandem.heuristic_tandem import HeuristicMixin
+from tandem.scip_tandem import ScipMixin
+from tandem.portfolio_tandem import PortfolioMixin
 from tandem.asymmetric_tandem import _languages_with_teachers_and_pupils,\
     _is_teacher, _is_pupil
 from tandem.humans import Human
 
 class BaseSuboptimalSeater(Seater):
+
+    kind = 'suboptimal'
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.already_teacher = set()
         self.already_pupil = set()
+        self.round = 1
     
     def seat(self):
-        seatings_round1, not_matched_round1 = super().seat()
-        self.already_pupil, self.already_teacher = _fill_already_seated(seatings_round1)
-        seatings_round2, not_matched_round2 = super().seat()
+        self.already_teacher = set()
+        self.already_pupil = set()
+        self.round = 1
+        self._start_seating()
+        seatings_round1, not_matched_round1 = self._seat_round()
+        self.already_pupil, self.already_teacher = self._fill_already_seated(seatings_round1)
+        self.round = 2
+        seatings_round2, not_matched_round2 = self._seat_round()
         return (seatings_round1, seatings_round2), (not_matched_round1, not_matched_round2)
-        
 
-    def _valid_tables_with_languages(self, table):
-        common_languages = table[0].all_languages()
-        for human in table[1:]:
-            common_languages &= human.all_languages()
-            if not common_languages:
-                return
+    def _type_key(self, human):
+        roles = (human in self.already_teacher, human in self.already_pupil)
+        return super()._type_key(human) + roles
+
+    def _model_key(self):
+        return self.round
+
+    def _unseated(self, seatings):
+        seatings_round1, seatings_round2 = seatings
+        return self._not_matched(seatings_round1), self._not_matched(seatings_round2)
+        
 
-        languages = _languages_with_teachers_and_pupils(table, common_languages)
-        for language in languages:
-            language_combination = frozenset((language,))
-            yield table, language_combination
+    @staticmethod
+    def _language_masks(profiles):
+        return _languages_with_teachers_and_pupils(profiles)
 
     def _optimal_seatings(self, possible_tables):
         possible_tables = list(possible_tables)
@@ -49,33 +65,52 @@ class BaseSuboptimalSeater(Seater):
         return not_matched
     
     def _make_ilp_model(self, seating_model, is_seated, possible_tables):
-        total_unhappiness = self._solver_sum(self._unhappiness(*language_table) * is_seated[language_table]
-                                             for language_table in possible_tables)
+        coefficients = self._objective_coefficients(possible_tables)
+        total_unhappiness = self._solver_sum(coefficient * is_seated[language_table]
+                                             for coefficient, language_table in zip(coefficients,
+                                                                                    possible_tables))
         seating_model = self._add_objective_function(total_unhappiness, seating_model)
 
-        for human in self.humans:
-            total_seatings = self._solver_sum(is_seated[(table, languages)]
-                                              for table, languages in possible_tables if human in table)
-            seating_model = self._add_constraint(total_seatings == 1, "Must_seat_{}".format(human), seating_model)
+        for name, row in self._constraint_rows(possible_tables):
+            total_seatings = self._solver_sum(is_seated[possible_tables[idx]] for idx in row)
+            seating_model = self._add_constraint(total_seatings == 1, name, seating_model)
     
         return seating_model
     
-    def _unhappiness(self, table, language_combination):
+    def _constraint_rows(self, possible_tables):
+        for human, row in self._human_incidence(possible_tables).items():
+            yield "Must_seat_{}".format(human), row
+
+    def _objective_coefficients(self, possible_tables):
+        matrices = self._table_matrices(possible_tables)
+        already_teacher = self._roster_mask(self.already_teacher)
+        already_pupil = self._roster_mask(self.already_pupil)
+
+        unhappiness = ranking_unhappiness(matrices) + level_unhappiness(matrices)
+        unhappiness += 9999 * repeated_roles(matrices, already_teacher, already_pupil)
+        return unhappiness.tolist()
+
+    def _roster_mask(self, humans):
+        mask = np.zeros(len(self.humans), dtype=bool)
+        mask[[self.positions[human] for human in humans]] = True
+        return mask
+
+    def _unhappiness(self, profiles, mask):
         ranking_unhappiness = 0
         previous_round_unhappiness = 0
         levels = []
         
-        for human in table:
-            if (_is_teacher(human, language_combination) and human in self.already_teacher or
-                _is_pupil(human, language_combination) and human in self.already_pupil):
+        for profile in profiles:
+            human = profile.human
+            if (_is_teacher(profile, mask) and human in self.already_teacher or
+                _is_pupil(profile, mask) and human in self.already_pupil):
                 previous_round_unhappiness += 9999
             
-            for idx, (learning_language, level) in enumerate(human.learning_languages):
-                if learning_language in language_combination:
-                    ranking_unhappiness += idx
-                    levels.append(level)
-                    break
-        levels = [int(i) for i in levels]
+            learning = profile.first_learning(mask)
+            if learning is not None:
+                rank, level = learning
+                ranking_unhappiness += rank
+                levels.append(level)
         levels = np.array(levels)
         maximum = (max(levels))
         if maximum:
@@ -85,9 +120,23 @@ class BaseSuboptimalSeater(Seater):
         return total_unhappiness + previous_round_unhappiness
     
     def _optimized_tables(self, is_seated, seating_model):
-        chosen_tables = self._chosen_tables(is_seated, seating_model)
+        chosen_tables = self._solution_tables(is_seated, seating_model)
         chosen_tables = list(chosen_tables)
         return chosen_tables
+
+    def _fill_already_seated(self, seated):
+        already_teacher = set()
+        already_pupil = set()
+
+        for language_table in seated:
+            profiles, mask = self._profile_table(language_table)
+            for profile in profiles:
+                if _is_teacher(profile, mask):
+                    already_teacher.add(profile.human)
+                else:
+                    already_pupil.add(profile.human)
+
+        return already_pupil, already_teacher
     
 
 def _table_languages(table):
@@ -143,25 +192,27 @@ def _get_language_combinations(human):
     return {frozenset(combination) for combination in language_combinations}
 
 
-def _fill_already_seated(seated):
-    already_teacher = set()
-    already_pupil = set()
+class SuboptimalPulpSeater(BaseSuboptimalSeater, PulpMixin):
+    pass
 
-    for table, languages in seated:
-        for human in table:
-            if _is_teacher(human, languages):
-                already_teacher.add(human)
-            else:
-                already_pupil.add(human)
-    
-    return already_pupil, already_teacher
 
+class SuboptimalGurobiSeater(BaseSuboptimalSeater, GurobiMixin):
+    pass
 
-class SuboptimalPulpSeater(BaseSuboptimalSeater, PulpMixin):
+
+class SuboptimalHighsSeater(BaseSuboptimalSeater, HighsMixin):
     pass
 
 
-class SuboptimalGurobiSeater(BaseSuboptimalSeater, GurobiMixin):
+class SuboptimalHeuristicSeater(BaseSuboptimalSeater, HeuristicMixin):
+    pass
+
+
+class SuboptimalScipSeater(BaseSuboptimalSeater, ScipMixin):
+    pass
+
+
+class SuboptimalPortfolioSeater(BaseSuboptimalSeater, PortfolioMixin):
     pass
 
 
@@ -1,10 +1,17 @@
+import codecs
 import csv
+import io
+from itertools import islice
 from pathlib import Path
 
-from flask import Flask, render_template, request
+from flask import Flask, Response, abort, jsonify, redirect, render_template, request, url_for
 from celery import Celery
 
 from tandem.humans import Human
+from tandem.candidate_cache import CandidateCache
+from tandem.result_cache import ResultCache, seating_key
+from tandem.roster_store import RosterStore
+from tandem.payloads import seating_request, seater_from_request, roster_positions, encode_seatings, decode_result
 from tandem.symmetric_tandem import SymmetricGurobiSeater
 from tandem.asymmetric_tandem import AsymmetricGurobiSeater
 from tandem.asymmetric_tandem import AsymmetricPulpSeater
@@ -16,14 +23,22 @@ from tandem.suboptimal_tandem import SuboptimalGurobiSeater
 file_path = Path(__file__).resolve()
 base_path = file_path.parents[0].resolve()
 backup_path = base_path / 'backup.tsv'
+roster_path = base_path / 'roster.sqlite'
+results_path = base_path / 'results.sqlite'
+roster_columns = ('Name', 'Learning Languages', 'Teaching Languages')
+import_batch_size = 500
 default_path = base_path / 'default.tsv'
+candidate_cache_path = base_path / 'candidate_cache'
 template_path = file_path.parents[1] / 'templates'
 
 app = Flask(__name__,
             template_folder=str(template_path))
 app.config.update(
     CELERY_BROKER_URL='amqp://localhost',
-    CELERY_RESULT_BACKEND='amqp://localhost'
+    CELERY_RESULT_BACKEND='db+sqlite:///{}'.format(results_path),
+    CELERY_TASK_SERIALIZER='json',
+    CELERY_RESULT_SERIALIZER='json',
+    CELERY_ACCEPT_CONTENT=['json']
 )
 
 def make_celery(app):
@@ -40,6 +55,7 @@ def make_celery(app):
 
 
 celery = make_celery(app)
+candidate_cache = CandidateCache(candidate_cache_path)
 
 
 def parse_learning_languages(langs_string):
@@ -70,6 +86,55 @@ def _human_from_csv(csv_dict):
     return Human(name, learning_languages, teaching_languages)
 
 
+def _validated_human(csv_dict):
+    missing = [column for column in roster_columns if not (csv_dict.get(column) or '').strip()]
+    if missing:
+        raise ValueError('missing {}'.format(', '.join(missing)))
+
+    try:
+        learning_languages = parse_learning_languages(csv_dict['Learning Languages'])
+    except ValueError:
+        raise ValueError('learning languages must be "language, level" pairs')
+    for language, level in learning_languages:
+        if not language or not level.isdigit():
+            raise ValueError('invalid learning language {!r} with level {!r}'.format(language, level))
+
+    teaching_languages = parse_teaching_languages(csv_dict['Teaching Languages'])
+    if not all(teaching_languages):
+        raise ValueError('empty teaching language')
+    return Human(normalize(csv_dict['Name']), learning_languages, teaching_languages)
+
+
+def _import_rows(rows):
+    imported = 0
+    errors = []
+    valid_humans = _valid_humans(rows, errors)
+    while True:
+        batch = list(islice(valid_humans, import_batch_size))
+        if not batch:
+            return imported, errors
+        lines = {id(human): line for line, human in batch}
+        clashing = _roster().add_many(human for _, human in batch)
+        for human in clashing:
+            errors.append({'line': lines[id(human)], 'error': '{} is already in the roster'.format(human.name)})
+        imported += len(batch) - len(clashing)
+
+
+def _valid_humans(rows, errors):
+    for line, row in enumerate(rows, start=2):
+        try:
+            yield line, _validated_human(row)
+        except ValueError as error:
+            errors.append({'line': line, 'error': str(error)})
+
+
+def _delimiter(filename):
+    requested = request.values.get('delimiter')
+    if requested:
+        return '\t' if requested in ('tab', '\\t') else requested[0]
+    return ',' if filename.lower().endswith('.csv') else '\t'
+
+
 def _load_backup():
     load_path = backup_path if backup_path.exists() else default_path
     with load_path.open() as load_file:
@@ -78,12 +143,27 @@ def _load_backup():
             yield _human_from_csv(row)
 
 
-HUMANS = list(_load_backup())
+def _open_roster():
+    is_new = not roster_path.exists()
+    store = RosterStore(roster_path)
+    if is_new:
+        store.add_many(_load_backup())
+    return store
+
+
+roster = None
+
+
+def _roster():
+    global roster
+    if roster is None:
+        roster = _open_roster()
+    return roster
 
 
 @app.route('/')
 def add_humans():
-    return render_template('humans.html', humans=HUMANS)
+    return render_template('humans.html', humans=_roster().humans())
 
 
 @app.route('/', methods=['POST'])
@@ -98,49 +178,166 @@ def humans_post():
         return delete_all_humans()
 
 
+@app.route('/roster/import', methods=['POST'])
+def import_roster():
+    upload = request.files.get('roster')
+    if upload is None:
+        abort(400)
+    lines = codecs.iterdecode(upload.stream, 'utf-8-sig')
+    reader = csv.DictReader(lines, delimiter=_delimiter(upload.filename or ''))
+    imported, errors = _import_rows(reader)
+    if imported:
+        SEATING_JOBS.clear()
+    return jsonify(imported=imported, errors=errors)
+
+
+@app.route('/roster/export')
+def export_roster():
+    delimiter = ',' if request.args.get('format') == 'csv' else '\t'
+    extension = 'csv' if delimiter == ',' else 'tsv'
+    humans = _roster().humans()
+
+    def rows():
+        line = io.StringIO()
+        writer = csv.DictWriter(line, roster_columns, delimiter=delimiter)
+        writer.writeheader()
+        for human in humans:
+            yield line.getvalue()
+            line.seek(0)
+            line.truncate()
+            writer.writerow(human.to_dict())
+        yield line.getvalue()
+
+    return Response(rows(),
+                    mimetype='text/{}'.format('csv' if extension == 'csv' else 'tab-separated-values'),
+                    headers={'Content-Disposition': 'attachment; filename=roster.{}'.format(extension)})
+
+
 def delete_human(req):
-    delete_name = req.form['remove']
-    for idx, human in enumerate(HUMANS):
-        if human.name == delete_name:
-            HUMANS.pop(idx)
-    return render_template('humans.html', humans=HUMANS)
+    if _roster().remove(req.form['remove']):
+        SEATING_JOBS.clear()
+    return render_template('humans.html', humans=_roster().humans())
+
+
+JOB_KINDS = {'symmetric': (SymmetricGurobiSeater, dict(max_table_size=5, max_level_difference=1)),
+             'asymmetric': (AsymmetricGurobiSeater, dict(max_table_size=3, max_level_difference=2)),
+             'suboptimal': (SuboptimalGurobiSeater, dict(max_table_size=5, max_level_difference=10))}
+
+SEATER_CLASSES = {seater_class.__name__: seater_class for seater_class, _ in JOB_KINDS.values()}
+
+SEATING_JOBS = ResultCache(max_entries=32)
 
 
 @app.route('/results_symmetric')
 def show_symmetric_results():
-    _save_backup()
-    seater = SymmetricGurobiSeater(HUMANS, max_table_size=5, max_level_difference=1)
-    task = async_seat.delay(seater)
-    tables, unseated = task.wait()
-    return render_template('result_symmetric.html', tables=tables, unseated=unseated)
+    return _job_redirect('symmetric')
 
 
 @app.route('/results_asymmetric')
 def show_asymmetric_results():
-    _save_backup()
-    seater = AsymmetricGurobiSeater(HUMANS, max_table_size=3, max_level_difference=2)
-    task = async_seat.delay(seater)
-    (round1, round2), (unseated_round_1, unseated_round_2) = task.wait()
-    return render_template('result_asymmetric.html', round1=round1, round2=round2, unseated_round_1=unseated_round_1, unseated_round_2=unseated_round_2)
+    return _job_redirect('asymmetric')
 
 
 @app.route('/results_suboptimal')
 def show_suboptimal_results():
-    _save_backup()
-    seater = SuboptimalGurobiSeater(HUMANS, max_table_size=5, max_level_difference=10)
-    task = async_seat.delay(seater)
-    (round1, round2), (unseated_round_1, unseated_round_2) = task.wait()
+    return _job_redirect('suboptimal')
+
+
+@app.route('/jobs/<kind>', methods=['POST'])
+def submit_job(kind):
+    job_id = _submit_job(kind)
+    response = jsonify(job_id=job_id,
+                       status_url=url_for('job_status', kind=kind, job_id=job_id),
+                       result_url=url_for('job_result', kind=kind, job_id=job_id))
+    response.status_code = 202
+    return response
+
+
+@app.route('/jobs/<kind>/<job_id>')
+def show_job(kind, job_id):
+    _check_kind(kind)
+    return render_template('job.html',
+                           kind=kind,
+                           status_url=url_for('job_status', kind=kind, job_id=job_id),
+                           result_url=url_for('job_result', kind=kind, job_id=job_id))
+
+
+@app.route('/jobs/<kind>/<job_id>/status')
+def job_status(kind, job_id):
+    _check_kind(kind)
+    task = async_seat.AsyncResult(job_id)
+    return jsonify(job_id=job_id, state=task.state, ready=task.ready())
+
+
+@app.route('/jobs/<kind>/<job_id>/result')
+def job_result(kind, job_id):
+    _check_kind(kind)
+    task = async_seat.AsyncResult(job_id)
+    if not task.ready():
+        return redirect(url_for('show_job', kind=kind, job_id=job_id))
+    if task.failed():
+        abort(500)
+
+    if kind == 'symmetric':
+        tables, unseated = decode_result(task.get())
+        return render_template('result_symmetric.html', tables=tables, unseated=unseated)
+    (round1, round2), (unseated_round_1, unseated_round_2) = decode_result(task.get())
     return render_template('result_asymmetric.html', round1=round1, round2=round2, unseated_round_1=unseated_round_1, unseated_round_2=unseated_round_2)
 
 
+def _job_redirect(kind):
+    job_id = _submit_job(kind)
+    if async_seat.AsyncResult(job_id).successful():
+        return redirect(url_for('job_result', kind=kind, job_id=job_id))
+    return redirect(url_for('show_job', kind=kind, job_id=job_id))
+
+
+def _check_kind(kind):
+    if kind not in JOB_KINDS:
+        abort(404)
+
+
+def _submit_job(kind):
+    _check_kind(kind)
+    humans = _roster().humans()
+    seater_class, params = JOB_KINDS[kind]
+    key = seating_key(seater_class, humans, **params)
+    job_id = SEATING_JOBS.get(key)
+    if job_id is not None and async_seat.AsyncResult(job_id).state != 'FAILURE':
+        return job_id
+
+    job_id = async_seat.delay(seating_request(seater_class, humans, **params)).id
+    SEATING_JOBS.put(key, job_id)
+    return job_id
+
+
 @celery.task(name='async_seat')
-def async_seat(seater):
-    return seater.seat()
+def async_seat(payload):
+    seater = seater_from_request(payload, SEATER_CLASSES, candidate_cache=candidate_cache)
+    roster = seater.humans
+    seater = _incremental_seater(seater)
+    seatings, unseated = seater.seat()
+    return encode_seatings(seatings, unseated, roster_positions(seater.humans, roster), request=payload)
+
+
+INCREMENTAL_SEATERS = {}
+
+
+def _incremental_seater(seater):
+    key = (type(seater), seater.max_table_size, seater.max_level_difference)
+    previous_seater = INCREMENTAL_SEATERS.get(key)
+    if previous_seater is None:
+        INCREMENTAL_SEATERS[key] = seater
+        return seater
+
+    previous_seater.update_roster(seater.humans)
+    return previous_seater
 
 
 def delete_all_humans():
-    del HUMANS[:]
-    return render_template('humans.html', humans=HUMANS)
+    _roster().clear()
+    SEATING_JOBS.clear()
+    return render_template('humans.html', humans=_roster().humans())
 
 
 def enter_new_human(r):
@@ -152,21 +349,16 @@ def enter_new_human(r):
     teaching_languages = parse_teaching_languages(teaching_languages)
     name = normalize(name)
     make_new_human(name, learning_languages, teaching_languages)
-    return render_template('humans.html', humans=HUMANS)
+    return render_template('humans.html', humans=_roster().humans())
 
 
 def make_new_human(name, learning_languages, teaching_languages):
     human = Human(name=name, learning_languages=learning_languages, teaching_languages=teaching_languages)
-    HUMANS.append(human)
-
-
-def _save_backup():
-    with backup_path.open('w') as backup_file:
-        cols = ('Name', 'Learning Languages', 'Teaching Languages')
-        writer = csv.DictWriter(backup_file, cols, delimiter='\t')
-        writer.writeheader()
-        for human in HUMANS:
-            writer.writerow(human.to_dict())
+    try:
+        _roster().add(human)
+    except ValueError:
+        abort(409)
+    SEATING_JOBS.clear()
 
 
 if __name__ == '__main__':
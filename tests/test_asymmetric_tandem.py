@@ -1,7 +1,11 @@
-from pytest import fixture, mark
+from itertools import permutations
 
+from pytest import approx, fixture, mark, raises
+
+from tandem.base_tandem import HUMANS
 from tandem.humans import Human
-from tandem.asymmetric_tandem import AsymmetricPulpSeater, AsymmetricGurobiSeater
+from tandem.asymmetric_tandem import AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater,\
+    _overlapping_table_combos, _valid_table_combo, _is_pupil
 
 
 @fixture
@@ -13,7 +17,7 @@ def humans_matching_small_and_big_groups():
     return humans
 
 
-@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater])
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater])
 def test_prefer_small_groups(seater_class, humans_matching_small_and_big_groups):
     target = seater_class(humans_matching_small_and_big_groups,
                           max_table_size=4,
@@ -44,7 +48,7 @@ def humans_with_optimal_solution():
     return humans, solution
 
 
-@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater])
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater])
 def test_finds_optimal_solution(seater_class, humans_with_optimal_solution):
     humans, expected = humans_with_optimal_solution
     target = seater_class(humans,
@@ -71,7 +75,7 @@ def unsolvable_humans():
     return [anna, bert]
 
 
-@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater])
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater])
 def test_unsolvable(seater_class, unsolvable_humans):
     target = seater_class(unsolvable_humans,
                           max_table_size=4,
@@ -94,7 +98,7 @@ def only_teacher_humans():
     return [anna, bert]
 
 
-@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater])
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater])
 def test_only_teacher(seater_class, only_teacher_humans):
     target = seater_class(only_teacher_humans,
                           max_table_size=4,
@@ -119,7 +123,7 @@ def too_small_tables_humans():
     return [anna, bert, clara], table_size
 
 
-@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater])
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater])
 def test_too_small_tables(seater_class, too_small_tables_humans):
     humans, table_size = too_small_tables_humans
     target = seater_class(humans,
@@ -133,4 +137,80 @@ def test_too_small_tables(seater_class, too_small_tables_humans):
     assert actual_seated == expected_seated
 
     expected_unseated = (humans, humans)
-    assert actual_unseated == expected_unseated
\ No newline at end of file
+    assert actual_unseated == expected_unseated
+
+
+def test_overlapping_table_combos_match_all_permutations():
+    target = AsymmetricPulpSeater(HUMANS, max_table_size=3, max_level_difference=8)
+    possible_tables = list(set(target._filtered_tables()))
+    profile_tables = {table: target._profile_table(table) for table in possible_tables}
+
+    actual = list(_overlapping_table_combos(possible_tables, profile_tables))
+    expected = [(table_1, table_2) for table_1, table_2 in permutations(possible_tables, 2)
+                if _valid_table_combo(profile_tables[table_1], profile_tables[table_2])]
+
+    assert actual == expected
+
+
+def test_streamed_model_matches_materialized_pairs():
+    target = AsymmetricHighsSeater(HUMANS[:8], max_table_size=3, max_level_difference=8)
+    tables = target._join_tables(target._candidate_tables())
+
+    is_seated, model = target._built_model(tables)
+    pairs = list(_overlapping_table_combos(list(tables), tables))
+
+    assert list(is_seated) == pairs
+    objective = model.objective_vector()
+    expected = target._objective_coefficients(pairs)
+    assert [objective[is_seated[pair].index] for pair in pairs] == approx(expected)
+
+    matrix = model.constraint_matrix()
+    for row, (name, expected_row) in enumerate(target._constraint_rows(pairs)):
+        assert model.row_names[row] == name
+        assert sorted(matrix[[row], :].indices) == sorted(is_seated[pairs[idx]].index for idx in expected_row)
+
+
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricGurobiSeater, AsymmetricHighsSeater])
+def test_round_formulation_matches_pair_formulation(seater_class, humans_with_optimal_solution):
+    humans, expected = humans_with_optimal_solution
+    target = seater_class(humans, max_table_size=4, max_level_difference=0, rounds=2)
+
+    (actual_first, actual_second), (unseated_first, unseated_second) = target.seat()
+
+    assert unseated_first == unseated_second == []
+    assert sorted(actual_first + actual_second, key=str) == sorted(expected, key=str)
+
+
+@mark.parametrize("rounds", [2, 3])
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricHighsSeater])
+def test_round_formulation_lets_everyone_teach_and_learn(seater_class, rounds):
+    target = seater_class(HUMANS, max_table_size=3, max_level_difference=8, rounds=rounds, heuristic_start=0.1)
+
+    seatings, unseated = target.seat()
+
+    assert len(seatings) == rounds
+    assert unseated == ([],) * rounds
+    for round_tables in seatings:
+        seated = [human for table, _ in round_tables for human in table]
+        assert sorted(seated, key=str) == sorted(HUMANS, key=str)
+    for human in HUMANS:
+        roles = {_is_pupil(target.profiles[human], target._profile_table(language_table)[1])
+                 for round_tables in seatings for language_table in round_tables if human in language_table[0]}
+        assert roles == {True, False}
+
+
+def test_round_formulation_grows_linearly():
+    pair_seater = AsymmetricHighsSeater(HUMANS[:8], max_table_size=3, max_level_difference=8)
+    round_seater = AsymmetricHighsSeater(HUMANS[:8], max_table_size=3, max_level_difference=8, rounds=3)
+    tables = pair_seater._join_tables(pair_seater._candidate_tables())
+
+    pairs, _ = pair_seater._built_model(tables)
+    rounds, model = round_seater._built_model(tables)
+
+    assert len(rounds) == 3 * len(tables) < len(pairs)
+    assert model.row_count == 5 * len(HUMANS[:8])
+
+
+def test_round_formulation_needs_two_rounds():
+    with raises(ValueError):
+        AsymmetricHighsSeater(HUMANS[:4], max_table_size=3, max_level_difference=8, rounds=1)
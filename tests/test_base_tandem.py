@@ -0,0 +1,113 @@
+from pytest import approx, mark, raises
+import pulp
+
+from tandem.base_tandem import HUMANS
+from tandem.benchmark import synthetic_roster
+from tandem.humans import Human
+from tandem.symmetric_tandem import SymmetricPulpSeater, SymmetricHighsSeater
+from tandem.asymmetric_tandem import AsymmetricPulpSeater
+from tandem.suboptimal_tandem import SuboptimalPulpSeater, SuboptimalHighsSeater
+
+
+def _brute_force_tables(seater):
+    tables = pulp.allcombinations(seater.humans, seater.max_table_size)
+    for table in tables:
+        if len(table) < 2:
+            continue
+        yield from seater._valid_tables_with_languages(table)
+
+
+@mark.parametrize("seater_class", [SymmetricPulpSeater, AsymmetricPulpSeater, SuboptimalPulpSeater])
+@mark.parametrize("max_table_size", [2, 3, 4])
+@mark.parametrize("max_level_difference", [0, 8])
+def test_language_tables_match_brute_force(seater_class, max_table_size, max_level_difference):
+    target = seater_class(HUMANS,
+                          max_table_size=max_table_size,
+                          max_level_difference=max_level_difference)
+
+    actual = set(target._filtered_tables())
+    expected = set(_brute_force_tables(target))
+
+    assert actual == expected
+
+
+def _table_names(tables):
+    return sorted((tuple(human.name for human in table), tuple(sorted(languages))) for table, languages in tables)
+
+
+@mark.parametrize("seater_class", [SymmetricPulpSeater, AsymmetricPulpSeater, SuboptimalPulpSeater])
+def test_update_roster_matches_fresh_candidates(seater_class):
+    target = seater_class(HUMANS[:10], max_table_size=3, max_level_difference=8)
+    target.seat()
+
+    roster = HUMANS[2:]
+    target.update_roster(roster)
+    expected = seater_class(roster, max_table_size=3, max_level_difference=8)
+
+    assert sorted(human.name for human in target.humans) == sorted(human.name for human in roster)
+    assert _table_names(target._candidate_tables()) == _table_names(expected._candidate_tables())
+
+
+def test_reseat_after_update_matches_fresh_seating():
+    target = SymmetricHighsSeater(HUMANS[:10], max_table_size=4, max_level_difference=8)
+    target.seat()
+
+    target.update_roster(HUMANS[1:])
+    actual_tables, actual_unseated = target.seat()
+    expected_tables, expected_unseated = SymmetricHighsSeater(HUMANS[1:], max_table_size=4,
+                                                              max_level_difference=8).seat()
+
+    coefficients = dict(zip(expected_tables, target._objective_coefficients(expected_tables)))
+    coefficients.update(zip(actual_tables, target._objective_coefficients(actual_tables)))
+    assert sum(coefficients[table] for table in actual_tables) == \
+        approx(sum(coefficients[table] for table in expected_tables))
+    assert actual_unseated == expected_unseated == []
+
+
+def _cloned_roster(copies):
+    return HUMANS + [Human('{}_{}'.format(human.name, copy), human.learning_languages, human.teaching_languages)
+                     for copy in range(copies) for human in HUMANS]
+
+
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricHighsSeater])
+def test_aggregated_seating_matches_individual_seating(seater_class):
+    roster = _cloned_roster(2)
+    target = seater_class(roster, max_table_size=3, max_level_difference=8, aggregate_profiles=True)
+    actual_tables, actual_unseated = target.seat()
+    expected_tables, expected_unseated = seater_class(roster, max_table_size=3, max_level_difference=8).seat()
+
+    seated = [human for table, _ in actual_tables for human in table]
+    assert sorted(seated, key=roster.index) == roster
+    assert sum(target._objective_coefficients(actual_tables)) == \
+        approx(sum(target._objective_coefficients(expected_tables)))
+    assert actual_unseated == expected_unseated == []
+
+
+@mark.parametrize("seed", [0, 6])
+def test_aggregated_suboptimal_seating_matches_individual_seating(seed):
+    roster = synthetic_roster(12, languages=['en', 'de', 'fr'], max_learning=1, max_teaching=1,
+                              duplicate_rate=0.5, seed=seed)
+    target = SuboptimalHighsSeater(roster, max_table_size=3, max_level_difference=9, aggregate_profiles=True)
+    actual_rounds, actual_unseated = target.seat()
+    expected_rounds, expected_unseated = SuboptimalHighsSeater(roster, max_table_size=3,
+                                                               max_level_difference=9).seat()
+
+    scorer = SuboptimalHighsSeater(roster, max_table_size=3, max_level_difference=9)
+    assert sum(scorer._objective_coefficients(actual_rounds[0])) == \
+        approx(sum(scorer._objective_coefficients(expected_rounds[0])))
+    assert [len(unseated) for unseated in actual_unseated] == [len(unseated) for unseated in expected_unseated]
+
+
+def test_aggregated_asymmetric_seating_is_not_supported():
+    with raises(ValueError):
+        AsymmetricPulpSeater(HUMANS, max_table_size=3, max_level_difference=8, aggregate_profiles=True)
+
+
+def test_variables_are_named_by_dense_ids():
+    target = SymmetricPulpSeater(HUMANS, max_table_size=3, max_level_difference=8)
+    possible_tables = list(target._candidate_tables())
+    is_seated, _ = target._solved_variables_and_model(possible_tables)
+
+    assert len(target.variable_tables) == len(set(possible_tables))
+    for variable_id, language_table in enumerate(target.variable_tables):
+        assert is_seated[language_table].name == 't{}'.format(variable_id)
@@ -0,0 +1,57 @@
+from tandem.batch import seat_batch
+from tandem.benchmark import synthetic_roster
+from tandem.result_cache import ResultCache
+from tandem.symmetric_tandem import SymmetricHighsSeater
+
+
+def _table_names(seatings):
+    return sorted((sorted(human.name for human in table), sorted(languages)) for table, languages in seatings)
+
+
+def test_batch_streams_every_job(tmp_path):
+    rosters = [synthetic_roster(8, seed=seed) for seed in range(3)]
+    parameters = dict(max_table_size=3, max_level_difference=8)
+    jobs = [(humans, 'symmetric', parameters) for humans in rosters]
+    jobs.append((list(reversed(rosters[0])), 'symmetric', parameters))
+    jobs.append((rosters[1], 'asymmetric', dict(parameters, rounds=2)))
+
+    results = {index: (seatings, unseated)
+               for index, seatings, unseated in seat_batch(jobs, max_workers=2,
+                                                           candidate_cache_path=str(tmp_path))}
+
+    assert sorted(results) == list(range(len(jobs)))
+    for index, humans in enumerate(rosters):
+        expected, _ = SymmetricHighsSeater(humans, **parameters).seat()
+        assert _table_names(results[index][0]) == _table_names(expected)
+    assert _table_names(results[3][0]) == _table_names(results[0][0])
+    assert {human for table, _ in results[3][0] for human in table} <= set(jobs[3][0])
+    assert len(results[4][0]) == len(results[4][1]) == 2
+
+
+def test_batch_reuses_cached_results():
+    humans = synthetic_roster(8, seed=4)
+    jobs = [(humans, 'symmetric', dict(max_table_size=3, max_level_difference=8))]
+    cache = ResultCache()
+
+    first = list(seat_batch(jobs, max_workers=1, result_cache=cache))
+    second = list(seat_batch(jobs, max_workers=1, result_cache=cache))
+
+    assert len(cache) == 1
+    assert first == second
+
+
+def test_failed_job_does_not_stop_the_batch():
+    humans = synthetic_roster(8, seed=5)
+    parameters = dict(max_table_size=3, max_level_difference=8)
+    jobs = [(humans, 'symmetric', parameters),
+            (humans, 'asymmetric', dict(parameters, rounds=1)),
+            (synthetic_roster(8, seed=6), 'symmetric', parameters)]
+
+    results = {index: (seatings, unseated) for index, seatings, unseated in seat_batch(jobs, max_workers=2)}
+
+    assert sorted(results) == [0, 1, 2]
+    error, unseated = results[1]
+    assert isinstance(error, ValueError) and unseated is None
+    for index in (0, 2):
+        expected, _ = SymmetricHighsSeater(jobs[index][0], **parameters).seat()
+        assert _table_names(results[index][0]) == _table_names(expected)
@@ -0,0 +1,59 @@
+import json
+
+import tandem.benchmark as benchmark
+from tandem.benchmark import synthetic_roster, run_benchmark, regressions, main
+
+
+def test_synthetic_roster_is_reproducible():
+    first = synthetic_roster(50, seed=3)
+    second = synthetic_roster(50, seed=3)
+
+    assert [human.fingerprint() for human in first] == [human.fingerprint() for human in second]
+
+
+def test_synthetic_roster_respects_parameters():
+    humans = synthetic_roster(200, languages=['english', 'german', 'french'], max_learning=1, levels=(2, 4),
+                              duplicate_rate=0.5)
+
+    for human in humans:
+        (language, level), = human.learning_languages
+        assert 2 <= level <= 4
+        assert language not in human.teaching_languages
+        assert human.all_languages() <= {'english', 'german', 'french'}
+    profiles = {human.fingerprint()[1:] for human in humans}
+    assert len(profiles) < len(humans) / 2
+
+
+def test_benchmark_records_stages_and_detects_regressions():
+    results = run_benchmark(sizes=[8], kinds=['symmetric', 'suboptimal'], backends=['highs'])
+
+    for result in results['results']:
+        names = {stage['name'] for stage in result['stats']['stages']}
+        assert {'tables', 'filtered_tables', 'model_build', 'solve'} <= names
+    assert regressions(results, results) == []
+
+    baseline = {'results': [dict(result, seconds=result['seconds'] / 10) for result in results['results']]}
+    assert len(regressions(results, baseline)) == len(results['results'])
+
+
+def test_cli_passes_roster_shape_and_skips_missing_backends(tmp_path, monkeypatch):
+    rosters = []
+
+    def recording_roster(*args, **kwargs):
+        humans = synthetic_roster(*args, **kwargs)
+        rosters.append(humans)
+        return humans
+    monkeypatch.setattr(benchmark, 'synthetic_roster', recording_roster)
+    monkeypatch.setattr(benchmark, 'available_solvers', lambda names: [])
+    output = tmp_path / 'benchmark.json'
+
+    main(['--sizes', '12', '--kinds', 'symmetric', '--backends', 'highs', 'gurobi', 'scip', '--languages', '3',
+          '--language-weights', '50', '1', '1', '--levels', '2', '4', '--output', str(output)])
+
+    results = json.loads(output.read_text())
+    assert results['parameters']['levels'] == [2, 4]
+    assert results['parameters']['language_weights'] == [50, 1, 1]
+    assert [result.get('skipped') for result in results['results']] == [None, 'not available', 'not available']
+    humans, = rosters
+    assert all(2 <= level <= 4 for human in humans for _, level in human.learning_languages)
+    assert sum('english' in dict(human.learning_languages) for human in humans) >= 10
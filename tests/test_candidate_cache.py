@@ -0,0 +1,91 @@
+import os
+
+from pytest import fixture, mark
+
+import tandem.candidate_cache as candidate_cache
+
+from tandem.base_tandem import HUMANS
+from tandem.benchmark import synthetic_roster
+from tandem.humans import Human
+from tandem.candidate_cache import CandidateCache
+from tandem.symmetric_tandem import SymmetricHighsSeater
+from tandem.asymmetric_tandem import AsymmetricHighsSeater
+from tandem.suboptimal_tandem import SuboptimalHighsSeater
+
+
+@fixture
+def cache(tmp_path):
+    return CandidateCache(tmp_path / 'candidates', max_entries=4)
+
+
+def _table_names(tables):
+    return sorted((tuple(human.name for human in table), tuple(sorted(languages))) for table, languages in tables)
+
+
+def _fail_enumeration(*args, **kwargs):
+    raise AssertionError("candidates should come from the cache")
+
+
+@mark.parametrize("seater_class", [SymmetricHighsSeater, AsymmetricHighsSeater, SuboptimalHighsSeater])
+def test_cached_candidates_skip_enumeration(seater_class, cache, monkeypatch):
+    expected = seater_class(HUMANS, max_table_size=3, max_level_difference=8)._candidate_tables()
+    seater_class(HUMANS, max_table_size=3, max_level_difference=8, candidate_cache=cache)._candidate_tables()
+
+    target = seater_class(HUMANS, max_table_size=3, max_level_difference=8, candidate_cache=cache)
+    monkeypatch.setattr(target, '_filtered_tables', _fail_enumeration)
+    actual = target._candidate_tables()
+
+    assert _table_names(actual) == _table_names(expected)
+    assert all(human in target.profiles for table, _ in actual for human in table)
+
+
+@mark.parametrize("seater_class", [SymmetricHighsSeater, AsymmetricHighsSeater, SuboptimalHighsSeater])
+@mark.parametrize("seed", [2, 4])
+def test_extended_candidates_match_fresh_enumeration(seater_class, seed, cache):
+    roster = synthetic_roster(12, languages=['en', 'de', 'fr'], max_learning=1, max_teaching=1,
+                              duplicate_rate=0.5, seed=seed)
+    seater_class(roster[:3] + roster[5:], max_table_size=3, max_level_difference=9,
+                 candidate_cache=cache)._candidate_tables()
+
+    target = seater_class(roster, max_table_size=3, max_level_difference=9, candidate_cache=cache)
+    expected = seater_class(roster, max_table_size=3, max_level_difference=9)
+
+    assert _table_names(target._candidate_tables()) == _table_names(expected._candidate_tables())
+
+
+def test_changed_participant_is_regenerated(cache):
+    SymmetricHighsSeater(HUMANS, max_table_size=3, max_level_difference=8, candidate_cache=cache)._candidate_tables()
+
+    roster = list(HUMANS)
+    roster[1] = Human(name='bert', learning_languages=[('french', 2)], teaching_languages=['english'])
+    expected = SymmetricHighsSeater(roster, max_table_size=3, max_level_difference=8)._candidate_tables()
+    actual = SymmetricHighsSeater(roster, max_table_size=3, max_level_difference=8,
+                                  candidate_cache=cache)._candidate_tables()
+
+    assert _table_names(actual) == _table_names(expected)
+
+
+def test_evicts_least_recently_used(cache):
+    for size in range(2, 8):
+        SymmetricHighsSeater(HUMANS[:size], max_table_size=2, max_level_difference=8,
+                             candidate_cache=cache)._candidate_tables()
+
+    assert len(list(cache.path.glob('*/*.pickle'))) == cache.max_entries
+
+
+def test_entry_evicted_after_loading_is_still_a_hit(cache, monkeypatch):
+    SymmetricHighsSeater(HUMANS, max_table_size=3, max_level_difference=8, candidate_cache=cache)._candidate_tables()
+    load = candidate_cache._load
+
+    def load_then_evict(entry_path):
+        cached = load(entry_path)
+        if entry_path is not None and entry_path.exists():
+            os.remove(str(entry_path))
+        return cached
+    monkeypatch.setattr(candidate_cache, '_load', load_then_evict)
+
+    target = SymmetricHighsSeater(HUMANS, max_table_size=3, max_level_difference=8, candidate_cache=cache)
+    monkeypatch.setattr(target, '_filtered_tables', _fail_enumeration)
+    expected = SymmetricHighsSeater(HUMANS, max_table_size=3, max_level_difference=8)._candidate_tables()
+
+    assert _table_names(target._candidate_tables()) == _table_names(expected)
@@ -0,0 +1,72 @@
+from pytest import fixture, mark
+
+from tandem.humans import Human
+from tandem.components import roster_components
+from tandem.symmetric_tandem import SymmetricHighsSeater
+from tandem.asymmetric_tandem import AsymmetricHighsSeater
+from tandem.suboptimal_tandem import SuboptimalHighsSeater
+
+
+@fixture
+def two_language_groups():
+    humans = [Human(name='anna', learning_languages=[('german', 2)], teaching_languages=['arabic']),
+              Human(name='bert', learning_languages=[('french', 2)], teaching_languages=['spanish']),
+              Human(name='clara', learning_languages=[('arabic', 2)], teaching_languages=['german']),
+              Human(name='dirk', learning_languages=[('spanish', 2)], teaching_languages=['french']),
+              Human(name='erik', learning_languages=[('german', 2)], teaching_languages=['arabic']),
+              Human(name='fritz', learning_languages=[('arabic', 2)], teaching_languages=['german']),
+              Human(name='greta', learning_languages=[('french', 2)], teaching_languages=['spanish']),
+              Human(name='hans', learning_languages=[('spanish', 2)], teaching_languages=['french'])]
+    return humans
+
+
+def _sizes(tables):
+    return sorted((len(table), sorted(languages)) for table, languages in tables)
+
+
+def test_roster_components(two_language_groups):
+    seater = SymmetricHighsSeater(two_language_groups, max_table_size=4, max_level_difference=0)
+
+    actual = roster_components(seater.humans, list(seater._filtered_tables()))
+
+    actual_names = sorted(sorted(human.name for human in component) for component in actual)
+    assert actual_names == [['anna', 'clara', 'erik', 'fritz'], ['bert', 'dirk', 'greta', 'hans']]
+
+
+def test_symmetric_components_match_single_model(two_language_groups):
+    target = SymmetricHighsSeater(two_language_groups, max_table_size=4, max_level_difference=0)
+
+    expected_tables, expected_unseated = target.seat()
+    actual_tables, actual_unseated = target.seat_by_components(max_workers=2)
+
+    assert _sizes(actual_tables) == _sizes(expected_tables)
+    assert actual_unseated == expected_unseated == []
+
+
+@mark.parametrize("seater_class", [AsymmetricHighsSeater, SuboptimalHighsSeater])
+def test_two_round_components_match_single_model(seater_class, two_language_groups):
+    target = seater_class(two_language_groups, max_table_size=3, max_level_difference=0)
+
+    (expected_first, expected_second), expected_unseated = target.seat()
+    (actual_first, actual_second), actual_unseated = target.seat_by_components(max_workers=2)
+
+    assert _sizes(actual_first + actual_second) == _sizes(expected_first + expected_second)
+    assert actual_unseated == expected_unseated == ([], [])
+
+
+def test_components_keep_human_identity(two_language_groups):
+    target = SymmetricHighsSeater(two_language_groups, max_table_size=4, max_level_difference=0)
+
+    actual_tables, _ = target.seat_by_components(max_workers=2)
+
+    seated = [human for table, _ in actual_tables for human in table]
+    assert all(any(human is original for original in two_language_groups) for human in seated)
+
+
+@mark.parametrize("seater_class", [SymmetricHighsSeater, AsymmetricHighsSeater, SuboptimalHighsSeater])
+def test_components_without_tables_match_seat(seater_class):
+    humans = [Human(name='anna', learning_languages=[('german', 2)], teaching_languages=['arabic']),
+              Human(name='bert', learning_languages=[('french', 2)], teaching_languages=['spanish'])]
+    target = seater_class(humans, max_table_size=3, max_level_difference=0)
+
+    assert target.seat_by_components() == target.seat()
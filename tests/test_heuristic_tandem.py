@@ -0,0 +1,96 @@
+from pytest import approx, fixture, mark
+
+from tandem.base_tandem import HUMANS
+from tandem.humans import Human
+from tandem.symmetric_tandem import SymmetricHeuristicSeater, SymmetricPulpSeater, SymmetricHighsSeater
+from tandem.asymmetric_tandem import AsymmetricHeuristicSeater
+from tandem.suboptimal_tandem import SuboptimalHeuristicSeater
+
+
+@fixture
+def humans_with_optimal_solution():
+    anna = Human(name='anna', learning_languages=[('english', 1), ('german', 10)], teaching_languages=['arabic', 'greek'])
+    bert = Human(name='bert', learning_languages=[('french', 1), ('german', 10)], teaching_languages=['arabic', 'spanish'])
+    clara = Human(name='clara', learning_languages=[('spanish', 1), ('arabic', 2)], teaching_languages=['german', 'english'])
+    dirk = Human(name='dirk', learning_languages=[('greek', 1), ('arabic', 2)], teaching_languages=['german', 'french'])
+
+    humans = [anna, bert, clara, dirk]
+    symmetric_solution = [((anna, clara), frozenset(['english', 'arabic'])),
+                          ((bert, dirk), frozenset(['french', 'arabic']))]
+    asymmetric_solution = [((anna, clara), frozenset(['english'])),
+                           ((anna, dirk), frozenset(['greek'])),
+                           ((bert, dirk), frozenset(['french'])),
+                           ((bert, clara), frozenset(['spanish']))]
+
+    return humans, symmetric_solution, asymmetric_solution
+
+
+def test_symmetric_finds_optimal_solution(humans_with_optimal_solution):
+    humans, expected, _ = humans_with_optimal_solution
+    target = SymmetricHeuristicSeater(humans, max_table_size=4, max_level_difference=0, time_budget=0.5)
+
+    actual, unseated = target.seat()
+
+    assert unseated == []
+    assert sorted(actual, key=repr) == sorted(expected, key=repr)
+
+
+def test_asymmetric_finds_optimal_solution(humans_with_optimal_solution):
+    humans, _, expected = humans_with_optimal_solution
+    target = AsymmetricHeuristicSeater(humans, max_table_size=4, max_level_difference=0, time_budget=0.5)
+
+    (actual_first, actual_second), unseated = target.seat()
+
+    assert unseated == ([], [])
+    assert sorted(actual_first + actual_second, key=repr) == sorted(expected, key=repr)
+
+
+def test_suboptimal_prefers_small_groups():
+    humans = [Human(name='anna', learning_languages=[('german', 10)], teaching_languages=['arabic']),
+              Human(name='bert', learning_languages=[('german', 10)], teaching_languages=['arabic']),
+              Human(name='clara', learning_languages=[('arabic', 2)], teaching_languages=['german']),
+              Human(name='dirk', learning_languages=[('arabic', 2)], teaching_languages=['german'])]
+    target = SuboptimalHeuristicSeater(humans, max_table_size=4, max_level_difference=0, time_budget=0.5)
+
+    (actual_first, actual_second), unseated = target.seat()
+
+    assert unseated == ([], [])
+    assert len(actual_first) == len(actual_second) == 2
+
+
+def test_seats_as_many_as_possible():
+    anna = Human(name='anna', learning_languages=[('english', 1)], teaching_languages=['french'])
+    bert = Human(name='bert', learning_languages=[('french', 1)], teaching_languages=['english'])
+    clara = Human(name='clara', learning_languages=[('french', 1)], teaching_languages=['english'])
+    target = SymmetricHeuristicSeater([anna, bert, clara], max_table_size=2, max_level_difference=0)
+
+    actual, unseated = target.seat()
+
+    assert len(actual) == 1
+    assert len(unseated) == 1
+
+
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricHighsSeater])
+def test_heuristic_start_keeps_optimum(seater_class):
+    cold = seater_class(HUMANS, max_table_size=4, max_level_difference=8)
+    warm = seater_class(HUMANS, max_table_size=4, max_level_difference=8, heuristic_start=0.2)
+
+    cold_tables, cold_unseated = cold.seat()
+    warm_tables, warm_unseated = warm.seat()
+
+    possible_tables = list(cold._filtered_tables())
+    coefficients = dict(zip(possible_tables, cold._objective_coefficients(possible_tables)))
+    assert sum(coefficients[table] for table in warm_tables) == \
+        approx(sum(coefficients[table] for table in cold_tables))
+    assert warm_unseated == cold_unseated
+
+
+def test_pulp_warm_start_leaves_model_solver_alone():
+    target = SymmetricPulpSeater(HUMANS, max_table_size=4, max_level_difference=8, heuristic_start=0.2)
+    possible_tables = target._candidate_tables()
+    is_seated, model = target._built_model(possible_tables)
+
+    target._set_start(is_seated, target._heuristic_tables(possible_tables), model)
+
+    assert model.solver is None
+    assert any(var.varValue == 1 for var in is_seated.values())
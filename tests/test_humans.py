@@ -0,0 +1,23 @@
+from tandem.humans import Human, LanguageTable, Profile, language_ids
+
+
+def test_profile_masks():
+    language_table = LanguageTable()
+    anna = Human(name='anna', learning_languages=[('german', '10'), ('english', 2)], teaching_languages=['french'])
+    target = Profile(anna, language_table)
+
+    german, english, french = (language_table.id(language) for language in ('german', 'english', 'french'))
+    assert target.levels == (10, 2)
+    assert target.learning == 1 << german | 1 << english
+    assert target.teaching == 1 << french
+    assert target.combinations == {1 << german | 1 << french, 1 << english | 1 << french}
+    assert target.first_learning(1 << english | 1 << french) == (1, 2)
+    assert target.first_learning(1 << french) is None
+
+
+def test_language_table_round_trip():
+    target = LanguageTable()
+    mask = target.mask(['greek', 'arabic'])
+
+    assert sorted(language_ids(mask)) == [0, 1]
+    assert target.combination(mask) == frozenset(['greek', 'arabic'])
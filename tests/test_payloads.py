@@ -0,0 +1,71 @@
+import json
+
+from pytest import mark, raises
+
+from tandem.base_tandem import HUMANS
+from tandem.payloads import seating_request, seater_from_request, roster_positions, encode_seatings, \
+    decode_seatings, decode_roster, decode_result
+from tandem.symmetric_tandem import SymmetricHighsSeater
+from tandem.suboptimal_tandem import SuboptimalHighsSeater
+
+
+SEATER_CLASSES = {'SymmetricHighsSeater': SymmetricHighsSeater, 'SuboptimalHighsSeater': SuboptimalHighsSeater}
+
+
+def _json_roundtrip(payload):
+    return json.loads(json.dumps(payload))
+
+
+def test_roster_roundtrip():
+    payload = _json_roundtrip(seating_request(SymmetricHighsSeater, HUMANS, 3, 1))
+
+    assert [human.fingerprint() for human in decode_roster(payload)] == [human.fingerprint() for human in HUMANS]
+    assert set(payload['languages']) == {'german', 'french', 'english', 'greek'}
+
+
+@mark.parametrize("seater_class", [SymmetricHighsSeater, SuboptimalHighsSeater])
+def test_seatings_roundtrip(seater_class):
+    payload = _json_roundtrip(seating_request(seater_class, HUMANS, 3, 8))
+    seater = seater_from_request(payload, SEATER_CLASSES)
+    seatings, unseated = seater.seat()
+
+    result = encode_seatings(seatings, unseated, roster_positions(seater.humans, HUMANS))
+    actual = decode_seatings(_json_roundtrip(result), HUMANS)
+
+    expected = seater_class(HUMANS, 3, 8).seat()
+    assert _names(actual) == _names(expected)
+
+
+def test_result_carries_its_roster():
+    request = _json_roundtrip(seating_request(SymmetricHighsSeater, HUMANS, 3, 8))
+    seater = seater_from_request(request, SEATER_CLASSES)
+    seatings, unseated = seater.seat()
+
+    result = encode_seatings(seatings, unseated, roster_positions(seater.humans, decode_roster(request)), request)
+    actual = decode_result(_json_roundtrip(result))
+
+    assert _names(actual) == _names((seatings, unseated))
+
+
+def test_positions_follow_fingerprints_not_identity():
+    reordered = decode_roster(seating_request(SymmetricHighsSeater, HUMANS[::-1], 3, 1))
+
+    positions = roster_positions(reordered, HUMANS)
+
+    assert [positions[human] for human in reordered] == list(range(len(HUMANS)))[::-1]
+
+
+def test_unknown_version_is_rejected():
+    payload = seating_request(SymmetricHighsSeater, HUMANS, 3, 1)
+    payload['version'] = 0
+
+    with raises(ValueError):
+        decode_roster(payload)
+
+
+def _names(obj):
+    if isinstance(obj, (tuple, list)):
+        return type(obj)(_names(item) for item in obj)
+    if isinstance(obj, frozenset):
+        return obj
+    return obj.name
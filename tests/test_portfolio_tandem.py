@@ -0,0 +1,101 @@
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pulp
+from pytest import raises
+
+import tandem.portfolio_tandem as portfolio_tandem
+from tandem.portfolio_tandem import available_solvers, race, _first_optimum
+
+
+def _model():
+    model = pulp.LpProblem('portfolio', pulp.LpMinimize)
+    variables = [pulp.LpVariable('t{}'.format(idx), 0, 1, pulp.LpInteger) for idx in range(4)]
+    model += pulp.lpSum((idx + 1) * var for idx, var in enumerate(variables))
+    model += (variables[0] + variables[1] >= 1, 'first')
+    model += (variables[0] + variables[1] <= 1, 'second')
+    model += (variables[2] + variables[3] >= 1, 'third')
+    return model, variables
+
+
+def test_unavailable_solvers_are_skipped():
+    expected = ['cbc'] + (['scip'] if shutil.which('scip') else [])
+
+    assert available_solvers(['cbc', 'scip']) == expected
+
+
+def test_seaters_import_without_pulp_highs():
+    # PuLP 2.4, as pinned in requirements.txt, has no HiGHS command
+    script = ('import pulp; del pulp.HiGHS; '
+              'import tandem.symmetric_tandem, tandem.asymmetric_tandem, tandem.suboptimal_tandem; '
+              'from tandem.portfolio_tandem import SOLVERS, available_solvers; '
+              'assert "highs" not in SOLVERS; assert available_solvers(["highs", "cbc"]) == ["cbc"]')
+
+    subprocess.run([sys.executable, '-c', script], cwd=str(Path(__file__).parents[1]), check=True)
+
+
+def test_race_maps_solution_back_by_name():
+    model, variables = _model()
+
+    winner = race(model, available_solvers(['cbc', 'gurobi']))
+
+    assert winner in ('cbc', 'gurobi')
+    assert model.sol_status == pulp.LpSolutionOptimal
+    assert [var.value() for var in variables] == [1, 0, 1, 0]
+
+
+def test_race_needs_a_solver():
+    model, _ = _model()
+
+    with raises(pulp.PulpSolverError):
+        race(model, [])
+
+
+def test_race_with_deadline_returns_solution():
+    model, variables = _model()
+
+    winner = race(model, ['cbc'], deadline=5.0)
+
+    assert winner == 'cbc'
+    assert model.sol_status == pulp.LpSolutionOptimal
+    assert [var.value() for var in variables] == [1, 0, 1, 0]
+
+
+def test_incumbents_reported_after_the_deadline_are_kept():
+    results = queue.Queue()
+
+    def _report():
+        time.sleep(0.2)
+        results.put(('cbc', pulp.LpStatusNotSolved, pulp.LpSolutionIntegerFeasible, 3.0, {'t0': 1.0}))
+        results.put(('gurobi', pulp.LpStatusNotSolved, pulp.LpSolutionIntegerFeasible, 2.0, {'t1': 1.0}))
+    threading.Thread(target=_report).start()
+
+    racers = {'cbc': _Racer(None), 'gurobi': _Racer(None)}
+    actual = _first_optimum(results, racers, time.monotonic())
+
+    assert actual == ('gurobi', pulp.LpStatusNotSolved, pulp.LpSolutionIntegerFeasible, {'t1': 1.0})
+
+
+class _Racer:
+    def __init__(self, exitcode):
+        self.exitcode = exitcode
+
+
+def _crash(*args):
+    os._exit(1)
+
+
+def test_race_without_deadline_survives_crashed_racers(monkeypatch):
+    model, _ = _model()
+    monkeypatch.setattr(portfolio_tandem, '_solve_file', _crash)
+
+    winner = race(model, ['cbc'])
+
+    assert winner is None
+    assert model.sol_status == pulp.LpSolutionNoSolutionFound
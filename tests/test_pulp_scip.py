@@ -0,0 +1,97 @@
+import os
+import stat
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+import pulp
+from pytest import fixture, raises
+
+from scip.pulp_scip import SCIP_CMD, readsol
+
+
+FAKE_SCIP = '''\
+    import sys, time
+    commands = [sys.argv[idx + 1] for idx, arg in enumerate(sys.argv) if arg == '-c']
+    reads = [command.split('"')[1] for command in commands if command.startswith('read')]
+    solution = [command.split('"')[1] for command in commands if command.startswith('write solution')][0]
+    start = open(reads[1]).readlines()[1:] if len(reads) > 1 else []
+    time.sleep(0.2)
+    with open(solution, 'w') as f:
+        f.write('solution status: optimal solution found\\n')
+        f.write('objective value: %d\\n' % len(start))
+        f.writelines(start)
+'''
+
+
+@fixture
+def fake_scip(tmp_path):
+    path = tmp_path / 'scip'
+    path.write_text('#!{}\n'.format(sys.executable) + textwrap.dedent(FAKE_SCIP))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def _model(name, start):
+    model = pulp.LpProblem(name, pulp.LpMinimize)
+    variables = [pulp.LpVariable('t{}'.format(idx), 0, 1, pulp.LpInteger) for idx in range(3)]
+    model += pulp.lpSum(variables)
+    model += (pulp.lpSum(variables) >= 1, 'cover')
+    variables[start].setInitialValue(1)
+    return model, variables
+
+
+def test_readsol_streams_values(tmp_path):
+    solution = tmp_path / 'model.sol'
+    solution.write_text('solution status: optimal solution found\n'
+                        'objective value:                                    2\n'
+                        't0                                                  1 \t(obj:1)\n'
+                        't3                                                  1 \t(obj:1)\n')
+
+    assert readsol(str(solution)) == (pulp.LpStatusOptimal, pulp.LpSolutionOptimal, {'t0': 1.0, 't3': 1.0})
+
+
+def test_readsol_keeps_incumbent_at_limit(tmp_path):
+    solution = tmp_path / 'model.sol'
+    solution.write_text('solution status: time limit reached\n'
+                        'objective value:                                    1\n'
+                        't2                                                  1 \t(obj:1)\n')
+    assert readsol(str(solution)) == (pulp.LpStatusNotSolved, pulp.LpSolutionIntegerFeasible, {'t2': 1.0})
+
+    solution.write_text('solution status: infeasible\nno solution available\n')
+    assert readsol(str(solution)) == (pulp.LpStatusInfeasible, pulp.LpSolutionInfeasible, {})
+
+
+def test_readsol_rejects_unknown_status(tmp_path):
+    solution = tmp_path / 'model.sol'
+    solution.write_text('solution status: confused\n')
+
+    with raises(pulp.PulpSolverError):
+        readsol(str(solution))
+
+
+def test_command_sets_limits():
+    solver = SCIP_CMD(path='scip', timeLimit=30, gapRel=0.01, threads=4, options=['-q'])
+
+    command = solver.command('model.lp', 'model.sol', 'start.sol')
+
+    assert command[0] == 'scip'
+    assert command[1::2][:-1] == ['-c'] * 8
+    assert command[2::2] == ['read "model.lp"', 'read "start.sol"', 'set limits time 30',
+                             'set limits gap 0.01', 'set lp threads 4', 'optimize',
+                             'write solution "model.sol"', 'quit']
+    assert command[-1] == '-q'
+
+
+def test_concurrent_solves_do_not_share_files(fake_scip, tmp_path):
+    models = [_model('model{}'.format(idx), idx) for idx in range(3)]
+    solver = SCIP_CMD(path=fake_scip, warmStart=True)
+    solver.tmpDir = str(tmp_path)
+
+    with ThreadPoolExecutor(len(models)) as executor:
+        statuses = list(executor.map(lambda model: model[0].solve(solver), models))
+
+    assert statuses == [pulp.LpStatusOptimal] * len(models)
+    for idx, (model, variables) in enumerate(models):
+        assert [var.value() for var in variables] == [1.0 if var_idx == idx else 0.0 for var_idx in range(3)]
+    assert not [name for name in os.listdir(str(tmp_path)) if name.startswith('pulp-scip-')]
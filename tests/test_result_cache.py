@@ -0,0 +1,33 @@
+from tandem.base_tandem import HUMANS
+from tandem.humans import Human
+from tandem.result_cache import ResultCache, seating_key
+from tandem.symmetric_tandem import SymmetricPulpSeater, SymmetricGurobiSeater
+
+
+def test_seating_key_ignores_roster_order():
+    assert seating_key(SymmetricPulpSeater, HUMANS, 3, 1) == seating_key(SymmetricPulpSeater, HUMANS[::-1], 3, 1)
+
+
+def test_seating_key_depends_on_roster_and_parameters():
+    key = seating_key(SymmetricPulpSeater, HUMANS, 3, 1)
+    changed = HUMANS[:-1] + [Human('ad', [('german', 3), ('english', 2)], ['french'])]
+
+    assert key != seating_key(SymmetricPulpSeater, changed, 3, 1)
+    assert key != seating_key(SymmetricPulpSeater, HUMANS[:-1], 3, 1)
+    assert key != seating_key(SymmetricGurobiSeater, HUMANS, 3, 1)
+    assert key != seating_key(SymmetricPulpSeater, HUMANS, 4, 1)
+    assert key != seating_key(SymmetricPulpSeater, HUMANS, 3, 2)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert 'b' not in cache
+    assert (cache.get('a'), cache.get('c'), len(cache)) == (1, 3, 2)
+    cache.clear()
+    assert cache.get('a') is None
@@ -0,0 +1,53 @@
+from pytest import raises
+
+from tandem.base_tandem import HUMANS
+from tandem.humans import Human
+from tandem.roster_store import RosterStore
+
+
+def _fingerprints(humans):
+    return [human.fingerprint() for human in humans]
+
+
+def test_roster_survives_reopening(tmp_path):
+    store = RosterStore(tmp_path / 'roster.sqlite')
+    store.add_many(HUMANS)
+    store.remove('clara')
+    store.add(Human('zoe', [('greek', 3)], ['german']))
+    store.close()
+
+    reopened = RosterStore(tmp_path / 'roster.sqlite')
+
+    expected = [human for human in HUMANS if human.name != 'clara'] + [Human('zoe', [('greek', 3)], ['german'])]
+    assert _fingerprints(reopened.humans()) == _fingerprints(expected)
+    assert reopened.get('zoe').learning_languages == [('greek', 3)]
+
+
+def test_adding_a_known_name_is_rejected(tmp_path):
+    store = RosterStore(tmp_path / 'roster.sqlite')
+    store.add_many(HUMANS[:3])
+    twin = Human('bert', [('greek', 1)], ['german'])
+    zoe = Human('zoe', [('greek', 3)], ['german'])
+
+    with raises(ValueError):
+        store.add(twin)
+    clashing = store.add_many([zoe, twin, Human('zoe', [('french', 2)], ['german'])])
+
+    assert [human.fingerprint() for human in clashing] == \
+        [twin.fingerprint(), ('zoe', (('french', '2'),), ('german',))]
+    assert [human.name for human in store] == ['anna', 'bert', 'clara', 'zoe']
+    assert store.get('bert').fingerprint() == HUMANS[1].fingerprint()
+    assert _fingerprints(RosterStore(tmp_path / 'roster.sqlite').humans()) == _fingerprints(HUMANS[:3] + [zoe])
+
+
+def test_remove_and_clear(tmp_path):
+    store = RosterStore(tmp_path / 'roster.sqlite')
+    store.add_many(HUMANS)
+
+    assert store.remove('anna')
+    assert not store.remove('anna')
+    assert 'anna' not in store and 'bert' in store
+
+    store.clear()
+    assert store.humans() == []
+    assert len(RosterStore(tmp_path / 'roster.sqlite')) == 0
@@ -0,0 +1,46 @@
+from itertools import permutations
+
+from pytest import approx, fixture
+
+from tandem.base_tandem import HUMANS
+from tandem.symmetric_tandem import SymmetricPulpSeater, _unhappiness as symmetric_unhappiness
+from tandem.asymmetric_tandem import AsymmetricPulpSeater, _unhappiness as asymmetric_unhappiness
+from tandem.suboptimal_tandem import SuboptimalPulpSeater
+
+
+@fixture
+def humans():
+    return HUMANS
+
+
+def test_symmetric_batch_matches_per_table(humans):
+    target = SymmetricPulpSeater(humans, max_table_size=4, max_level_difference=8)
+    possible_tables = list(target._filtered_tables())
+
+    actual = target._objective_coefficients(possible_tables)
+    expected = [symmetric_unhappiness(*target._profile_table(table)) for table in possible_tables]
+
+    assert actual == approx(expected)
+
+
+def test_asymmetric_batch_matches_per_table(humans):
+    target = AsymmetricPulpSeater(humans, max_table_size=3, max_level_difference=8)
+    possible_tables = list(permutations(set(target._filtered_tables()), 2))
+
+    actual = target._objective_coefficients(possible_tables)
+    expected = [asymmetric_unhappiness(target._profile_table(table_1), target._profile_table(table_2))
+                for table_1, table_2 in possible_tables]
+
+    assert actual == approx(expected)
+
+
+def test_suboptimal_batch_matches_per_table(humans):
+    target = SuboptimalPulpSeater(humans, max_table_size=4, max_level_difference=8)
+    target.already_teacher = set(humans[:5])
+    target.already_pupil = set(humans[5:9])
+    possible_tables = list(target._filtered_tables())
+
+    actual = target._objective_coefficients(possible_tables)
+    expected = [target._unhappiness(*target._profile_table(table)) for table in possible_tables]
+
+    assert actual == approx(expected)
@@ -0,0 +1,92 @@
+import pulp
+from pytest import approx, fixture, mark
+
+import tandem.heuristic_tandem as heuristic_tandem
+import tandem.highs_tandem as highs_tandem
+from tandem.humans import Human
+from tandem.solver_options import SolverOptions
+from tandem.symmetric_tandem import (SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater,
+                                     SymmetricHeuristicSeater)
+
+
+@fixture
+def humans():
+    anna = Human(name='anna', learning_languages=[('english', 1), ('german', 10)], teaching_languages=['arabic', 'greek'])
+    bert = Human(name='bert', learning_languages=[('french', 1), ('german', 10)], teaching_languages=['arabic', 'spanish'])
+    clara = Human(name='clara', learning_languages=[('spanish', 1), ('arabic', 2)], teaching_languages=['german', 'english'])
+    dirk = Human(name='dirk', learning_languages=[('greek', 1), ('arabic', 2)], teaching_languages=['german', 'french'])
+    return [anna, bert, clara, dirk]
+
+
+def test_pulp_options_skip_unset_values():
+    options = SolverOptions(threads=2, gap=0.05)
+
+    assert options.pulp_options() == {'threads': 2, 'gapRel': 0.05}
+    assert options.pulp_options(1.5) == {'threads': 2, 'gapRel': 0.05, 'timeLimit': 1.5}
+    assert SolverOptions().deadline() is None
+
+
+def _record_forwarded_options(target, monkeypatch):
+    forwarded = {}
+    if isinstance(target, SymmetricPulpSeater):
+        solve = pulp.LpProblem.solve
+
+        def recording_solve(model, solver=None, **kwargs):
+            forwarded.update(threads=solver.optionsDict['threads'], gap=solver.optionsDict['gapRel'],
+                             time_limit=solver.timeLimit)
+            return solve(model, solver, **kwargs)
+        monkeypatch.setattr(pulp.LpProblem, 'solve', recording_solve)
+    elif isinstance(target, SymmetricGurobiSeater):
+        solve_model = target._solve_model
+
+        def recording_solve_model(model):
+            solve_model(model)
+            forwarded.update(threads=model.Params.Threads, gap=model.Params.MIPGap, time_limit=model.Params.TimeLimit)
+        monkeypatch.setattr(target, '_solve_model', recording_solve_model)
+    elif isinstance(target, SymmetricHighsSeater):
+        solve_with_highs = highs_tandem._solve_with_highs
+
+        def recording_solve_with_highs(model, options=None):
+            forwarded.update(gap=options['mip_rel_gap'], time_limit=options['time_limit'])
+            return solve_with_highs(model, options)
+        monkeypatch.setattr(highs_tandem, '_solve_with_highs', recording_solve_with_highs)
+    else:
+        packing_solution = heuristic_tandem.packing_solution
+
+        def recording_packing_solution(model, time_budget, **kwargs):
+            forwarded.update(time_limit=time_budget)
+            return packing_solution(model, time_budget, **kwargs)
+        monkeypatch.setattr(heuristic_tandem, 'packing_solution', recording_packing_solution)
+    return forwarded
+
+
+@mark.parametrize("seater_class, expected", [(SymmetricPulpSeater, {'threads': 1, 'gap': 0.001}),
+                                             (SymmetricGurobiSeater, {'threads': 1, 'gap': 0.001}),
+                                             (SymmetricHighsSeater, {'gap': 0.001}),
+                                             (SymmetricHeuristicSeater, {})])
+def test_options_reach_the_backend(seater_class, expected, humans, monkeypatch):
+    incumbents = []
+    options = SolverOptions(threads=1, time_limit=0.8, gap=0.001, on_incumbent=incumbents.append)
+    target = seater_class(humans, max_table_size=4, max_level_difference=0, solver_options=options)
+    forwarded = _record_forwarded_options(target, monkeypatch)
+
+    seatings, unseated = target.seat()
+
+    assert 0 < forwarded.pop('time_limit') <= 0.8
+    assert forwarded == expected
+    assert unseated == []
+    assert len(seatings) == 2
+    assert incumbents
+    assert min(incumbents) == approx(incumbents[-1])
+
+
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater])
+def test_expired_deadline_returns_best_known_seating(seater_class, humans):
+    options = SolverOptions(time_limit=0)
+    target = seater_class(humans, max_table_size=4, max_level_difference=0, heuristic_start=0.5,
+                          solver_options=options)
+
+    seatings, unseated = target.seat()
+
+    assert unseated == []
+    assert len(seatings) == 2
@@ -0,0 +1,95 @@
+from pytest import mark
+
+from tandem.base_tandem import HUMANS
+from tandem.humans import Human
+from tandem.stats import SeatingStats, OPTIMAL, INFEASIBLE
+from tandem.symmetric_tandem import SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater
+from tandem.asymmetric_tandem import AsymmetricPulpSeater, AsymmetricHighsSeater
+from tandem.suboptimal_tandem import SuboptimalHighsSeater
+
+
+def test_iterated_stage_is_not_counted_twice():
+    stats = SeatingStats()
+
+    with stats.stage('outer') as stage:
+        items = list(stats.iterate('inner', range(5)))
+        stage.counts['items'] = len(items)
+
+    inner, outer = stats.stages
+    assert (inner.name, inner.counts) == ('inner', {'inner': 5})
+    assert (outer.name, outer.counts) == ('outer', {'items': 5})
+    assert outer.seconds >= 0 and inner.seconds >= 0
+    assert stats.seconds == inner.seconds + outer.seconds
+
+
+def test_memory_peak_is_traced_on_request():
+    stats = SeatingStats(trace_memory=True)
+
+    with stats.stage('allocate'):
+        data = [0] * 100000
+
+    assert stats.stages[0].peak_memory >= len(data) * 8
+
+
+def test_nested_stage_keeps_outer_memory_peak():
+    stats = SeatingStats(trace_memory=True)
+
+    with stats.stage('outer'):
+        data = [0] * 100000
+        size = len(data) * 8
+        del data
+        with stats.stage('inner'):
+            [0] * 10
+
+    inner, outer = stats.stages
+    assert outer.peak_memory >= size > inner.peak_memory
+
+
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater])
+def test_seat_records_stages(seater_class):
+    reported = []
+    target = seater_class(HUMANS, max_table_size=3, max_level_difference=8, on_stage=reported.append)
+
+    target.seat()
+
+    names = [stage.name for stage in target.stats.stages]
+    assert names == ['tables', 'filtered_tables', 'model_build', 'solve', 'chosen_tables']
+    assert reported == target.stats.stages
+    stages = {stage.name: stage for stage in target.stats.stages}
+    candidates = stages['filtered_tables'].counts['candidates']
+    assert stages['model_build'].counts['variables'] == candidates
+    assert stages['model_build'].counts['constraints'] == len(HUMANS)
+    assert stages['model_build'].counts['nonzeros'] > candidates
+    assert target.stats.status == OPTIMAL
+
+
+def test_asymmetric_seat_records_joined_tables():
+    target = AsymmetricHighsSeater(HUMANS[:6], max_table_size=2, max_level_difference=8)
+
+    target.seat()
+
+    stages = {stage.name: stage for stage in target.stats.stages if stage.name != 'pair_join'}
+    join_tables, join_pairs = [stage for stage in target.stats.stages if stage.name == 'pair_join']
+    assert 0 < join_tables.counts['tables'] <= stages['filtered_tables'].counts['candidates']
+    assert join_pairs.counts['pairs'] == stages['model_build'].counts['variables'] == len(target.variable_tables)
+    assert target.stats.totals()['pair_join'] == join_tables.seconds + join_pairs.seconds
+
+
+def test_suboptimal_stats_cover_both_rounds():
+    target = SuboptimalHighsSeater(HUMANS, max_table_size=3, max_level_difference=8)
+
+    target.seat()
+
+    assert [stage.name for stage in target.stats.stages].count('solve') == 2
+
+
+@mark.parametrize("seater_class", [AsymmetricPulpSeater, AsymmetricHighsSeater])
+def test_infeasible_status_is_reported(seater_class):
+    humans = [Human(name='anna', learning_languages=[('english', 1)], teaching_languages=['french']),
+              Human(name='bert', learning_languages=[('french', 1)], teaching_languages=['english']),
+              Human(name='clara', learning_languages=[('french', 1)], teaching_languages=['english'])]
+    target = seater_class(humans, max_table_size=2, max_level_difference=0)
+
+    target.seat()
+
+    assert target.stats.status == INFEASIBLE
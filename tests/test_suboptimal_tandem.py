@@ -1,7 +1,7 @@
 from pytest import fixture, mark
 
 from tandem.humans import Human
-from tandem.suboptimal_tandem import SuboptimalGurobiSeater, SuboptimalPulpSeater
+from tandem.suboptimal_tandem import SuboptimalGurobiSeater, SuboptimalPulpSeater, SuboptimalHighsSeater
 
 
 @fixture
@@ -13,7 +13,7 @@ def humans_matching_small_and_big_groups():
     return humans
 
 
-@mark.parametrize("seater_class", [SuboptimalPulpSeater, SuboptimalGurobiSeater])
+@mark.parametrize("seater_class", [SuboptimalPulpSeater, SuboptimalGurobiSeater, SuboptimalHighsSeater])
 def test_prefer_small_groups(seater_class, humans_matching_small_and_big_groups):
     target = seater_class(humans_matching_small_and_big_groups,
                           max_table_size=4,
@@ -35,7 +35,7 @@ def unsolvable_humans():
     return [anna, bert]
 
 
-@mark.parametrize("seater_class", [SuboptimalPulpSeater, SuboptimalGurobiSeater])
+@mark.parametrize("seater_class", [SuboptimalPulpSeater, SuboptimalGurobiSeater, SuboptimalHighsSeater])
 def test_unsolvable(seater_class, unsolvable_humans):
     target = seater_class(unsolvable_humans,
                           max_table_size=4,
@@ -60,7 +60,7 @@ def too_small_tables_humans():
     return [anna, bert, clara], table_size
 
 
-@mark.parametrize("seater_class", [SuboptimalPulpSeater, SuboptimalGurobiSeater])
+@mark.parametrize("seater_class", [SuboptimalPulpSeater, SuboptimalGurobiSeater, SuboptimalHighsSeater])
 def test_too_small_tables(seater_class, too_small_tables_humans):
     humans, table_size = too_small_tables_humans
     target = seater_class(humans,
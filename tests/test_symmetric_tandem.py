@@ -1,7 +1,8 @@
 from pytest import fixture, mark
 
 from tandem.humans import Human
-from tandem.symmetric_tandem import SymmetricPulpSeater, SymmetricGurobiSeater
+from tandem.symmetric_tandem import (SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater,
+                                     SymmetricPortfolioSeater)
 
 
 @fixture
@@ -18,7 +19,8 @@ def humans_with_optimal_solution():
     return humans, solution
 
 
-@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater])
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater,
+                                   SymmetricPortfolioSeater])
 def test_finds_optimal_solution(seater_class, humans_with_optimal_solution):
     humans, expected = humans_with_optimal_solution
     target = seater_class(humans,
@@ -44,7 +46,7 @@ def unsolvable_humans():
     return [anna, bert]
 
 
-@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater])
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater])
 def test_unsolvable(seater_class, unsolvable_humans):
     target = seater_class(unsolvable_humans,
                           max_table_size=4,
@@ -67,7 +69,7 @@ def only_teacher_humans():
     return [anna, bert]
 
 
-@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater])
+@mark.parametrize("seater_class", [SymmetricPulpSeater, SymmetricGurobiSeater, SymmetricHighsSeater])
 def test_only_teacher(seater_class, only_teacher_humans):
     target = seater_class(only_teacher_humans,
                           max_table_size=4,
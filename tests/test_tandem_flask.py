@@ -0,0 +1,195 @@
+import csv
+import io
+
+from pytest import fixture
+
+import tandem.tandem_flask as tandem_flask
+from tandem.asymmetric_tandem import AsymmetricHighsSeater
+from tandem.base_tandem import HUMANS
+from tandem.candidate_cache import CandidateCache
+from tandem.humans import Human
+from tandem.result_cache import ResultCache
+from tandem.roster_store import RosterStore
+from tandem.symmetric_tandem import SymmetricHighsSeater
+
+
+@fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(tandem_flask, 'roster_path', tmp_path / 'roster.sqlite')
+    monkeypatch.setattr(tandem_flask, 'roster', RosterStore(tmp_path / 'roster.sqlite'))
+    monkeypatch.setattr(tandem_flask, 'candidate_cache', CandidateCache(tmp_path / 'candidate_cache'))
+    monkeypatch.setattr(tandem_flask, 'import_batch_size', 2)
+    return tandem_flask.app.test_client()
+
+
+class _Backend:
+    def __init__(self):
+        self.queued = []
+        self.results = {}
+
+    def delay(self, payload):
+        job = _AsyncResult(self, 'job-{}'.format(len(self.queued)))
+        self.queued.append((job.id, payload))
+        return job
+
+    def run(self, job_id):
+        payload = dict(self.queued)[job_id]
+        try:
+            self.results[job_id] = tandem_flask.async_seat(payload)
+        except Exception as error:
+            self.results[job_id] = error
+
+
+class _AsyncResult:
+    def __init__(self, backend, job_id):
+        self.backend = backend
+        self.id = job_id
+
+    @property
+    def state(self):
+        if self.id not in self.backend.results:
+            return 'PENDING'
+        return 'FAILURE' if self.failed() else 'SUCCESS'
+
+    def ready(self):
+        return self.id in self.backend.results
+
+    def failed(self):
+        return isinstance(self.backend.results.get(self.id), Exception)
+
+    def successful(self):
+        return self.ready() and not self.failed()
+
+    def get(self):
+        return self.backend.results[self.id]
+
+
+@fixture
+def jobs(client, monkeypatch):
+    backend = _Backend()
+    job_kinds = {'symmetric': (SymmetricHighsSeater, dict(max_table_size=3, max_level_difference=8)),
+                 'asymmetric': (AsymmetricHighsSeater, dict(max_table_size=3, max_level_difference=8))}
+    monkeypatch.setattr(tandem_flask, 'JOB_KINDS', job_kinds)
+    monkeypatch.setattr(tandem_flask, 'SEATER_CLASSES', {cls.__name__: cls for cls, _ in job_kinds.values()})
+    monkeypatch.setattr(tandem_flask, 'SEATING_JOBS', ResultCache(max_entries=32))
+    monkeypatch.setattr(tandem_flask, 'INCREMENTAL_SEATERS', {})
+    monkeypatch.setattr(tandem_flask.async_seat, 'delay', backend.delay)
+    monkeypatch.setattr(tandem_flask.async_seat, 'AsyncResult', lambda job_id: _AsyncResult(backend, job_id))
+    tandem_flask.roster.add_many(HUMANS[:8])
+    return backend
+
+
+def _upload(client, text, filename):
+    data = {'roster': (io.BytesIO(text.encode('utf8')), filename)}
+    return client.post('/roster/import', data=data, content_type='multipart/form-data')
+
+
+def test_import_validates_rows_and_inserts_in_batches(client):
+    text = ('Name\tLearning Languages\tTeaching Languages\n'
+            'Anna\tGerman, 10\tFrench, English\n'
+            'bert\tEnglish, 2, French, 2\tGerman\n'
+            'clara\tGerman\tFrench\n'
+            '\tGerman, 2\tFrench\n'
+            'dirk\tGerman, 2, English, 2\tFrench\n')
+
+    response = _upload(client, text, 'signups.tsv')
+
+    assert response.status_code == 200
+    assert response.get_json() == {'imported': 3,
+                                   'errors': [{'line': 4, 'error': 'learning languages must be "language, level" pairs'},
+                                              {'line': 5, 'error': 'missing Name'}]}
+    assert [human.name for human in tandem_flask.roster] == ['anna', 'bert', 'dirk']
+    assert tandem_flask.roster.get('bert').learning_languages == [('english', '2'), ('french', '2')]
+
+
+def test_csv_import_and_export_roundtrip(client):
+    humans = [Human('anna', [('german', '10')], ['french', 'english']),
+              Human('bert', [('english', '2'), ('french', '2')], ['german'])]
+    tandem_flask.roster.add_many(humans)
+
+    exported = client.get('/roster/export?format=csv')
+    assert exported.headers['Content-Disposition'] == 'attachment; filename=roster.csv'
+    rows = list(csv.DictReader(io.StringIO(exported.get_data(as_text=True))))
+    assert [row['Name'] for row in rows] == ['anna', 'bert']
+
+    tandem_flask.roster.clear()
+    response = _upload(client, exported.get_data(as_text=True), 'roster.csv')
+
+    assert response.get_json() == {'imported': 2, 'errors': []}
+    assert [human.fingerprint() for human in tandem_flask.roster] == [human.fingerprint() for human in humans]
+
+
+def test_import_reports_names_already_in_the_roster(client):
+    tandem_flask.roster.add(Human('anna', [('german', '10')], ['french']))
+    text = ('Name\tLearning Languages\tTeaching Languages\n'
+            'Anna\tGreek, 1\tFrench\n'
+            'bert\tEnglish, 2\tGerman\n'
+            'bert\tFrench, 2\tGerman\n')
+
+    response = _upload(client, text, 'signups.tsv')
+
+    assert response.get_json() == {'imported': 1,
+                                   'errors': [{'line': 2, 'error': 'anna is already in the roster'},
+                                              {'line': 4, 'error': 'bert is already in the roster'}]}
+    assert tandem_flask.roster.get('anna').learning_languages == [('german', '10')]
+
+
+def test_job_is_submitted_polled_and_rendered(client, jobs):
+    submitted = client.post('/jobs/symmetric')
+
+    assert submitted.status_code == 202
+    job = submitted.get_json()
+    assert job == {'job_id': 'job-0',
+                   'status_url': '/jobs/symmetric/job-0/status',
+                   'result_url': '/jobs/symmetric/job-0/result'}
+    assert client.post('/jobs/symmetric').get_json()['job_id'] == 'job-0'
+    assert client.get(job['status_url']).get_json() == {'job_id': 'job-0', 'state': 'PENDING', 'ready': False}
+    assert client.get(job['result_url']).headers['Location'].endswith('/jobs/symmetric/job-0')
+
+    jobs.run('job-0')
+
+    assert client.get(job['status_url']).get_json() == {'job_id': 'job-0', 'state': 'SUCCESS', 'ready': True}
+    result = client.get(job['result_url'])
+    assert result.status_code == 200
+    tables, _ = SymmetricHighsSeater(HUMANS[:8], 3, 8).seat()
+    page = result.get_data(as_text=True)
+    assert all(str(human) in page for table, _ in tables for human in table)
+
+
+def test_result_is_decoded_from_the_backend_alone(client, jobs):
+    job_id = client.post('/jobs/asymmetric').get_json()['job_id']
+    jobs.run(job_id)
+    tandem_flask.roster.clear()
+    tandem_flask.SEATING_JOBS.clear()
+
+    result = client.get('/jobs/asymmetric/{}/result'.format(job_id))
+
+    assert result.status_code == 200
+    assert 'anna' in result.get_data(as_text=True)
+    assert client.get('/results_asymmetric').headers['Location'].endswith('/jobs/asymmetric/job-1')
+
+
+def test_failed_job_is_resubmitted(client, jobs, monkeypatch):
+    monkeypatch.setitem(tandem_flask.SEATER_CLASSES, 'SymmetricHighsSeater', None)
+    job_id = client.post('/jobs/symmetric').get_json()['job_id']
+    jobs.run(job_id)
+
+    assert client.get('/jobs/symmetric/{}/status'.format(job_id)).get_json()['state'] == 'FAILURE'
+    assert client.get('/jobs/symmetric/{}/result'.format(job_id)).status_code == 500
+    assert client.post('/jobs/symmetric').get_json()['job_id'] == 'job-1'
+
+
+def test_unknown_job_kind_is_not_found(client, jobs):
+    assert client.post('/jobs/greek').status_code == 404
+    assert client.get('/jobs/greek/job-0/status').status_code == 404
+
+
+def test_roster_is_opened_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.setattr(tandem_flask, 'roster_path', tmp_path / 'roster.sqlite')
+    monkeypatch.setattr(tandem_flask, 'roster', None)
+
+    response = tandem_flask.app.test_client().get('/roster/export')
+
+    assert response.status_code == 200
+    assert (tmp_path / 'roster.sqlite').exists()
+    assert [human.name for human in tandem_flask.roster] == [human.name for human in tandem_flask._load_backup()]